@@ -3,15 +3,17 @@ Coach Agent using fallback template-based approach with intelligent resource rec
 This agent provides coaching feedback and intelligently searches for learning resources.
 """
 
+import asyncio
 import logging
 import json
+from functools import cached_property
 from typing import Dict, Any, List, Optional
 
 from langchain.prompts import PromptTemplate
 from langchain.chains import LLMChain
 
 from backend.agents.base import BaseAgent, AgentContext
-from backend.agents.tools.search_tool import LearningResourceSearchTool
+from backend.agents.tools.search_tool import LearningResourceSearchTool, run_search_sync
 from backend.services.llm_service import LLMService
 from backend.services.search_service import SearchService
 from backend.utils.event_bus import EventBus
@@ -27,6 +29,55 @@ from backend.utils.llm_utils import (
 from backend.utils.common import safe_get_or_default
 from backend.agents.constants import DEFAULT_VALUE_NOT_PROVIDED
 
+# Weakness wording that shifts the proficiency level used for resource searches
+FUNDAMENTAL_GAP_WORDS = ("basic", "fundamental", "foundation", "beginner")
+ADVANCED_NEED_WORDS = ("advanced", "complex", "deep", "sophisticated")
+
+# Why a resource was recommended, keyed by resource type
+RESOURCE_REASONING_TEMPLATES = {
+    "course": "This {resource_type} will help you build foundational knowledge in {topic}",
+    "tutorial": "This {resource_type} provides step-by-step guidance to improve your {topic} skills",
+    "documentation": "This official documentation will deepen your understanding of {topic}",
+    "article": "This {resource_type} covers key concepts that will strengthen your {topic} knowledge",
+    "video": "This {resource_type} offers visual learning to enhance your {topic} abilities",
+    "interactive": "This hands-on {resource_type} will let you practice {topic} skills directly",
+    "community": "This community resource provides ongoing support for learning {topic}"
+}
+DEFAULT_RESOURCE_REASONING = "This resource will help you improve your {topic} skills"
+
+# Last-resort resources when search and parsing both fail
+HARDCODED_FALLBACK_RESOURCES = (
+    {
+        "title": "Free Programming Courses on freeCodeCamp",
+        "url": "https://www.freecodecamp.org/learn",
+        "description": "Comprehensive free coding curriculum with hands-on projects and certifications.",
+        "resource_type": "course",
+        "reasoning": "This comprehensive platform will help you build strong programming fundamentals across multiple technologies"
+    },
+    {
+        "title": "Algorithm Fundamentals on Khan Academy",
+        "url": "https://www.khanacademy.org/computing/computer-science/algorithms",
+        "description": "Learn algorithmic thinking and fundamental computer science concepts.",
+        "resource_type": "course",
+        "reasoning": "This course will strengthen your problem-solving skills and algorithmic thinking abilities"
+    },
+    {
+        "title": "Technical Interview Preparation",
+        "url": "https://www.geeksforgeeks.org/interview-preparation/",
+        "description": "Practice coding problems and learn interview strategies for technical roles.",
+        "resource_type": "tutorial",
+        "reasoning": "This resource provides targeted practice for technical interviews to improve your performance"
+    },
+)
+
+# Feedback sections of the summary used when the LLM output can't be used
+DEFAULT_SUMMARY_FEEDBACK = {
+    "patterns_tendencies": "Could not generate patterns/tendencies feedback.",
+    "strengths": "Could not generate strengths feedback.",
+    "weaknesses": "Could not generate weaknesses feedback.",
+    "improvement_focus_areas": "Could not generate improvement focus areas."
+}
+
 
 class AgenticCoachAgent(BaseAgent):
     """
@@ -57,6 +108,25 @@ class AgenticCoachAgent(BaseAgent):
         
         self.logger.info("AgenticCoachAgent initialized with search functionality")
     
+    # Chains are built on first use and reused, instead of being rebuilt on every call
+    @cached_property
+    def evaluate_answer_chain(self) -> LLMChain:
+        """Chain that produces per-turn conversational feedback."""
+        return LLMChain(
+            llm=self.llm,
+            prompt=PromptTemplate.from_template(EVALUATE_ANSWER_TEMPLATE),
+            output_key="evaluation_text"
+        )
+    
+    @cached_property
+    def final_summary_chain(self) -> LLMChain:
+        """Chain that produces the end-of-interview summary JSON."""
+        return LLMChain(
+            llm=self.llm,
+            prompt=PromptTemplate.from_template(FINAL_SUMMARY_TEMPLATE),
+            output_key="summary_json"
+        )
+    
     def evaluate_answer(
         self, 
         question: str, 
@@ -71,11 +141,7 @@ class AgenticCoachAgent(BaseAgent):
             A string containing conversational coaching feedback.
         """
         try:
-            chain = LLMChain(
-                llm=self.llm,
-                prompt=PromptTemplate.from_template(EVALUATE_ANSWER_TEMPLATE),
-                output_key="evaluation_text"
-            )
+            chain = self.evaluate_answer_chain
             
             inputs = {
                 "resume_content": safe_get_or_default(self.resume_content, DEFAULT_VALUE_NOT_PROVIDED),
@@ -120,12 +186,8 @@ class AgenticCoachAgent(BaseAgent):
             
             # Step 2: Prepare LLM chain
             try:
-                chain = LLMChain(
-                    llm=self.llm,
-                    prompt=PromptTemplate.from_template(FINAL_SUMMARY_TEMPLATE),
-                    output_key="summary_json"
-                )
-                self.logger.info("✅ LLM chain created successfully")
+                chain = self.final_summary_chain
+                self.logger.info("✅ LLM chain ready")
             except Exception as e:
                 self.logger.exception(f"❌ Failed to create LLM chain: {e}")
                 return self._create_default_summary()
@@ -170,8 +232,9 @@ class AgenticCoachAgent(BaseAgent):
                     self.logger.info("✅ Response is already a dictionary")
                 elif isinstance(response, str):
                     self.logger.info("📄 Response is string, parsing JSON...")
-                    summary = parse_json_with_fallback(response, self._create_default_summary(), self.logger)
-                    if summary == self._create_default_summary():
+                    default_summary = self._create_default_summary()
+                    summary = parse_json_with_fallback(response, default_summary, self.logger)
+                    if summary is default_summary:
                         self.logger.error("❌ JSON parsing failed, using default summary")
                 else:
                     self.logger.warning(f"⚠️ Unexpected response type: {type(response)}, using default")
@@ -238,6 +301,7 @@ class AgenticCoachAgent(BaseAgent):
             List of resources with reasoning
         """
         generated_resources = []
+        search_topics = self._dedupe_search_topics(search_topics)
         
         if not search_topics:
             self.logger.warning("⚠️ No search topics provided for resource generation")
@@ -256,58 +320,52 @@ class AgenticCoachAgent(BaseAgent):
             
             self.logger.info(f"📊 Resource limits: {max_resources_per_topic} per topic, {max_total_resources} total")
             
-            for i, topic in enumerate(search_topics[:3]):  # Limit to 3 topics max
+            topics = search_topics[:3]  # Limit to 3 topics max
+            
+            # Determine proficiency level based on performance
+            proficiency_levels = self._determine_proficiency_levels(weaknesses, topics)
+            
+            # Searches are independent, so run them concurrently rather than one after another
+            topic_search_results = self._search_topics_concurrently(topics, proficiency_levels, max_resources_per_topic)
+            
+            # Lowercase the weaknesses once; whether a topic was called out is fixed per topic
+            weaknesses_lower = weaknesses.lower()
+            
+            for i, topic in enumerate(topics):
                 try:
-                    self.logger.info(f"🔍 Processing topic {i+1}/{min(3, len(search_topics))}: '{topic}'")
+                    self.logger.info("🔍 Processing topic %d/%d: '%s'", i + 1, len(topics), topic)
+                    addresses_gap = bool(weaknesses_lower) and topic.lower() in weaknesses_lower
+                    self.logger.info("📈 Determined proficiency level for '%s': %s", topic, proficiency_levels[i])
                     
-                    # Determine proficiency level based on performance
-                    proficiency_level = self._determine_proficiency_level(weaknesses, topic)
-                    self.logger.info(f"📈 Determined proficiency level for '{topic}': {proficiency_level}")
-                    
-                    # Search for resources
-                    try:
-                        self.logger.info(f"🌐 Searching for resources: skill='{topic}', level='{proficiency_level}', count={max_resources_per_topic}")
-                        search_results = self.search_tool._run(
-                            skill=topic, 
-                            proficiency_level=proficiency_level, 
-                            num_results=max_resources_per_topic
-                        )
-                        
-                        if search_results:
-                            self.logger.info(f"✅ Search completed for '{topic}': {len(search_results)} chars of results")
-                        else:
-                            self.logger.warning(f"⚠️ Empty search results for topic '{topic}'")
-                            continue
-                            
-                    except Exception as search_error:
-                        self.logger.exception(f"❌ Search failed for topic '{topic}': {search_error}")
+                    topic_resources = topic_search_results[i]
+                    if topic_resources:
+                        self.logger.info("✅ Search completed for '%s': %d resources", topic, len(topic_resources))
+                    else:
+                        self.logger.warning(f"⚠️ Empty search results for topic '{topic}'")
                         continue
                     
-                    # Extract resources and add reasoning
+                    # Add reasoning to each resource
                     try:
-                        topic_resources = self._extract_resources_from_search_text(search_results)
-                        self.logger.info(f"📚 Extracted {len(topic_resources)} resources for topic '{topic}'")
-                        
                         for j, resource in enumerate(topic_resources):
                             if len(generated_resources) >= max_total_resources:
-                                self.logger.info(f"🛑 Reached maximum resource limit ({max_total_resources})")
+                                self.logger.info("🛑 Reached maximum resource limit (%d)", max_total_resources)
                                 break
                                 
                             try:
                                 # Add reasoning based on the topic and user's performance
                                 resource["reasoning"] = self._generate_resource_reasoning(
-                                    resource, topic, weaknesses, improvement_areas
+                                    resource, topic, addresses_gap
                                 )
                                 
                                 generated_resources.append(resource)
-                                self.logger.debug(f"✅ Added resource {j+1} for topic '{topic}': {resource.get('title', 'Unknown')}")
+                                self.logger.debug("✅ Added resource %d for topic '%s': %s", j + 1, topic, resource.get('title', 'Unknown'))
                                 
                             except Exception as reasoning_error:
                                 self.logger.error(f"❌ Failed to add reasoning for resource {j+1} in topic '{topic}': {reasoning_error}")
                                 continue
                         
                     except Exception as extraction_error:
-                        self.logger.exception(f"❌ Resource extraction failed for topic '{topic}': {extraction_error}")
+                        self.logger.exception(f"❌ Resource processing failed for topic '{topic}': {extraction_error}")
                         continue
                     
                     if len(generated_resources) >= max_total_resources:
@@ -324,6 +382,88 @@ class AgenticCoachAgent(BaseAgent):
             self.logger.exception(f"❌ Unexpected error in resource generation: {e}")
             return []
     
+    @staticmethod
+    def _dedupe_search_topics(search_topics: List[Any]) -> List[str]:
+        """
+        Drop blank topics and topics that only differ by case or spacing.
+        
+        Args:
+            search_topics: Topics suggested by the LLM
+            
+        Returns:
+            Unique topics in their original order and first-seen spelling
+        """
+        seen = set()
+        unique_topics = []
+        for topic in search_topics or ():
+            if not isinstance(topic, str):
+                continue
+            # Same normalization as the search cache key, so each kept topic is a distinct search
+            key = " ".join(topic.lower().split())
+            if key and key not in seen:
+                seen.add(key)
+                unique_topics.append(topic.strip())
+        return unique_topics
+    
+    def _search_topics_concurrently(self, topics: List[str], proficiency_levels: List[str],
+                                    num_results: int) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        Run the resource search for each topic concurrently.
+        
+        Args:
+            topics: Topics to search for
+            proficiency_levels: Proficiency level for each topic
+            num_results: Number of resources to request per topic
+            
+        Returns:
+            Resources found for each topic, in input order (None if the search failed)
+        """
+        if not topics:
+            return []
+        
+        # One loop drives every search; the tool's shared pool is used if we're on a loop thread
+        try:
+            return run_search_sync(self._search_topics_async(topics, proficiency_levels, num_results))
+        except TimeoutError:
+            self.logger.warning(f"⚠️ Resource search timed out for {len(topics)} topics")
+            return [None] * len(topics)
+    
+    async def _search_topics_async(self, topics: List[str], proficiency_levels: List[str],
+                                   num_results: int) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        Await the resource searches for all topics together on one event loop.
+        
+        Args:
+            topics: Topics to search for
+            proficiency_levels: Proficiency level for each topic
+            num_results: Number of resources to request per topic
+            
+        Returns:
+            Resources found for each topic, in input order (None if the search failed)
+        """
+        async def search(topic: str, proficiency_level: str) -> Optional[List[Dict[str, Any]]]:
+            try:
+                self.logger.info("🌐 Searching for resources: skill='%s', level='%s', count=%d", topic, proficiency_level, num_results)
+                resources = await self.search_tool.find_free_resources(
+                    skill=topic,
+                    proficiency_level=proficiency_level,
+                    num_results=num_results
+                )
+                return [
+                    {
+                        "title": resource.title,
+                        "url": resource.url,
+                        "description": resource.description,
+                        "resource_type": resource.resource_type or "article"
+                    }
+                    for resource in resources
+                ]
+            except Exception as search_error:
+                self.logger.exception(f"❌ Search failed for topic '{topic}': {search_error}")
+                return None
+        
+        return list(await asyncio.gather(*map(search, topics, proficiency_levels)))
+    
     def _determine_proficiency_level(self, weaknesses: str, topic: str) -> str:
         """
         Determine appropriate proficiency level based on identified weaknesses.
@@ -335,139 +475,70 @@ class AgenticCoachAgent(BaseAgent):
         Returns:
             Proficiency level string
         """
+        return self._determine_proficiency_levels(weaknesses, [topic])[0]
+    
+    def _determine_proficiency_levels(self, weaknesses: str, topics: List[str]) -> List[str]:
+        """
+        Determine proficiency levels for several topics, scanning the weaknesses text once.
+        
+        Args:
+            weaknesses: The weaknesses section from the summary
+            topics: The topics being searched for
+            
+        Returns:
+            Proficiency level string for each topic, in input order
+        """
         if not weaknesses:
-            return "intermediate"
+            return ["intermediate"] * len(topics)
         
         weaknesses_lower = weaknesses.lower()
-        topic_lower = topic.lower()
         
         # Check for fundamental gaps
-        if any(word in weaknesses_lower for word in ["basic", "fundamental", "foundation", "beginner"]):
-            return "beginner"
+        if any(word in weaknesses_lower for word in FUNDAMENTAL_GAP_WORDS):
+            return ["beginner"] * len(topics)
         
         # Check for advanced needs
-        if any(word in weaknesses_lower for word in ["advanced", "complex", "deep", "sophisticated"]):
-            return "advanced"
-        
-        # Topic-specific adjustments
-        if topic_lower in weaknesses_lower:
-            # If the topic is specifically mentioned in weaknesses, start with beginner
-            return "beginner"
+        if any(word in weaknesses_lower for word in ADVANCED_NEED_WORDS):
+            return ["advanced"] * len(topics)
         
-        return "intermediate"
+        # Topic-specific adjustments: if the topic is specifically mentioned in weaknesses, start with beginner
+        return ["beginner" if topic.lower() in weaknesses_lower else "intermediate" for topic in topics]
     
     def _generate_resource_reasoning(self, resource: Dict[str, Any], topic: str, 
-                                   weaknesses: str, improvement_areas: str) -> str:
+                                   addresses_gap: bool) -> str:
         """
         Generate reasoning for why a specific resource was recommended.
         
         Args:
             resource: The resource dictionary
             topic: The topic this resource addresses
-            weaknesses: User's weaknesses
-            improvement_areas: Areas for improvement
+            addresses_gap: Whether the topic is called out in the user's weaknesses
             
         Returns:
             Reasoning string explaining why this resource was recommended
         """
         resource_type = resource.get("resource_type", "resource")
         
-        # Create reasoning based on the resource type and topic
-        reasoning_templates = {
-            "course": f"This {resource_type} will help you build foundational knowledge in {topic}",
-            "tutorial": f"This {resource_type} provides step-by-step guidance to improve your {topic} skills",
-            "documentation": f"This official documentation will deepen your understanding of {topic}",
-            "article": f"This {resource_type} covers key concepts that will strengthen your {topic} knowledge",
-            "video": f"This {resource_type} offers visual learning to enhance your {topic} abilities",
-            "interactive": f"This hands-on {resource_type} will let you practice {topic} skills directly",
-            "community": f"This community resource provides ongoing support for learning {topic}"
-        }
-        
-        base_reasoning = reasoning_templates.get(
-            resource_type.lower(), 
-            f"This resource will help you improve your {topic} skills"
-        )
+        # Only the matching template is formatted, rather than building all of them
+        template = RESOURCE_REASONING_TEMPLATES.get(resource_type.lower(), DEFAULT_RESOURCE_REASONING)
+        base_reasoning = template.format(resource_type=resource_type, topic=topic)
         
         # Add specific context based on weaknesses if available
-        if weaknesses and topic.lower() in weaknesses.lower():
-            base_reasoning += f", addressing the gaps identified in your interview performance"
+        if addresses_gap:
+            base_reasoning += ", addressing the gaps identified in your interview performance"
         
         return base_reasoning
     
-    def _extract_resources_from_search_text(self, search_text: str) -> List[Dict[str, Any]]:
-        """Extract resources from search tool output text."""
-        resources = []
-        
-        if "No suitable free learning resources found" in search_text:
-            return resources
-        
-        lines = search_text.split('\n')
-        current_resource = {}
-        
-        for line in lines:
-            line = line.strip()
-            
-            if line and line[0].isdigit() and "." in line:
-                # Save previous resource
-                if current_resource and all(key in current_resource for key in ["title", "url", "description"]):
-                    resources.append(current_resource)
-                
-                # Start new resource
-                title = line.split(".", 1)[1].strip()
-                if title.startswith("**") and title.endswith("**"):
-                    title = title[2:-2]
-                current_resource = {"title": title}
-            
-            elif line.startswith("Type:"):
-                current_resource["resource_type"] = line.replace("Type:", "").strip()
-            elif line.startswith("URL:"):
-                current_resource["url"] = line.replace("URL:", "").strip()
-            elif line.startswith("Description:"):
-                current_resource["description"] = line.replace("Description:", "").strip()
-        
-        # Add last resource
-        if current_resource and all(key in current_resource for key in ["title", "url", "description"]):
-            if "resource_type" not in current_resource:
-                current_resource["resource_type"] = "article"
-            resources.append(current_resource)
-        
-        return resources
-    
     def _create_default_summary(self) -> Dict[str, Any]:
         """Create a default summary structure."""
-        return {
-            "patterns_tendencies": "Could not generate patterns/tendencies feedback.",
-            "strengths": "Could not generate strengths feedback.",
-            "weaknesses": "Could not generate weaknesses feedback.",
-            "improvement_focus_areas": "Could not generate improvement focus areas.",
-            "recommended_resources": self._get_hardcoded_fallback_resources()
-        }
+        summary = DEFAULT_SUMMARY_FEEDBACK.copy()
+        summary["recommended_resources"] = self._get_hardcoded_fallback_resources()
+        return summary
     
     def _get_hardcoded_fallback_resources(self) -> List[Dict[str, Any]]:
         """Get hardcoded fallback resources as a last resort."""
-        return [
-            {
-                "title": "Free Programming Courses on freeCodeCamp",
-                "url": "https://www.freecodecamp.org/learn",
-                "description": "Comprehensive free coding curriculum with hands-on projects and certifications.",
-                "resource_type": "course",
-                "reasoning": "This comprehensive platform will help you build strong programming fundamentals across multiple technologies"
-            },
-            {
-                "title": "Algorithm Fundamentals on Khan Academy",
-                "url": "https://www.khanacademy.org/computing/computer-science/algorithms",
-                "description": "Learn algorithmic thinking and fundamental computer science concepts.",
-                "resource_type": "course",
-                "reasoning": "This course will strengthen your problem-solving skills and algorithmic thinking abilities"
-            },
-            {
-                "title": "Technical Interview Preparation",
-                "url": "https://www.geeksforgeeks.org/interview-preparation/",
-                "description": "Practice coding problems and learn interview strategies for technical roles.",
-                "resource_type": "tutorial",
-                "reasoning": "This resource provides targeted practice for technical interviews to improve your performance"
-            }
-        ]
+        # Copy so callers can't mutate the shared module-level entries
+        return [dict(resource) for resource in HARDCODED_FALLBACK_RESOURCES]
     
     def process(self, context: AgentContext) -> Any:
         """
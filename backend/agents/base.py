@@ -29,7 +29,8 @@ class AgentContext:
                  session_config: SessionConfig,
                  event_bus: EventBus,
                  logger: logging.Logger,
-                 metadata: Optional[Dict[str, Any]] = None
+                 metadata: Optional[Dict[str, Any]] = None,
+                 last_user_message: Optional[str] = None
                  ):
         self.session_id = session_id
         self.conversation_history = conversation_history
@@ -37,10 +38,17 @@ class AgentContext:
         self.event_bus = event_bus
         self.logger = logger
         self.metadata = metadata or {}
+        self.last_user_message = last_user_message
         self.created_at = datetime.now(timezone.utc)
 
     def get_last_user_message(self) -> Optional[str]:
-        """Gets the content of the last user message in the history."""
+        """
+        Gets the content of the last user message in the history.
+        Uses the tracked last_user_message when the caller provided it, and only
+        scans the history otherwise.
+        """
+        if self.last_user_message is not None:
+            return self.last_user_message
         for message in reversed(self.conversation_history):
             if message.get("role") == "user":
                 return message.get("content")
@@ -10,11 +10,15 @@ DEFAULT_FALLBACK_QUESTION = "Can you tell me about your professional background
 MINIMUM_QUESTION_COUNT = 3
 ESTIMATED_TIME_PER_QUESTION = 3  # minutes
 
+# Next actions the interviewer LLM may choose
+VALID_INTERVIEW_ACTIONS = frozenset({"ask_follow_up", "ask_new_question", "end_interview"})
+
 # Error messages
 ERROR_AGENT_LOAD_FAILED = "Agent could not be loaded"
 ERROR_INITIALIZATION_FAILED = "Initialization failed, no questions generated."
 ERROR_INTERVIEW_SETUP = "Sorry, I encountered an error setting up the interview questions."
 ERROR_PROCESSING_REQUEST = "Sorry, I encountered an error processing your request. Please try again."
+ERROR_EMPTY_MESSAGE = "Please enter a message."
 ERROR_INTERVIEW_CONCLUDED = "The interview has already concluded."
 ERROR_NO_QUESTION_TEXT = "It seems we've reached a natural stopping point. Thank you for your time."
 
@@ -29,4 +33,5 @@ LOG_INTERVIEW_CONCLUDED = "Interview concluded based on ReAct decision."
 # Coach feedback constants
 COACH_FEEDBACK_ERROR = "An error occurred while generating coach feedback for this turn."
 COACH_FEEDBACK_UNAVAILABLE = "Coach agent was not available to provide feedback for this turn."
-COACH_FEEDBACK_NOT_GENERATED = "Coach feedback was not generated for this turn." 
\ No newline at end of file
+COACH_FEEDBACK_NOT_GENERATED = "Coach feedback was not generated for this turn."
+COACH_FEEDBACK_PENDING = "Coach feedback for this turn is still being generated." 
\ No newline at end of file
@@ -4,6 +4,7 @@ Interviewer agent responsible for conducting interview sessions.
 
 import json
 import logging
+from functools import cached_property
 from typing import Dict, Any, List, Optional
 import random
 
@@ -35,7 +36,7 @@ from backend.agents.constants import (
     DEFAULT_JOB_ROLE, DEFAULT_COMPANY_NAME, DEFAULT_VALUE_NOT_PROVIDED,
     DEFAULT_OPENING_QUESTION, DEFAULT_FALLBACK_QUESTION, MINIMUM_QUESTION_COUNT,
     ESTIMATED_TIME_PER_QUESTION, ERROR_INTERVIEW_SETUP, ERROR_INTERVIEW_CONCLUDED,
-    ERROR_NO_QUESTION_TEXT, INTERVIEW_CONCLUSION
+    ERROR_NO_QUESTION_TEXT, INTERVIEW_CONCLUSION, VALID_INTERVIEW_ACTIONS
 )
 from backend.agents.interview_state import InterviewState, InterviewPhase
 
@@ -80,7 +81,9 @@ class InterviewerAgent(BaseAgent):
             self._setup_time_callbacks()
         
         self.state = InterviewState()
-        self._setup_llm_chains()
+        
+        # Session-invariant chain inputs; rebuilt lazily after config changes
+        self._profile_inputs: Optional[Dict[str, Any]] = None
         
         # Subscribe to events
         self.subscribe(EventType.SESSION_START, self._handle_session_start)
@@ -132,17 +135,23 @@ TIME AWARENESS:
         
         return base_prompt + time_context
     
-    def _setup_llm_chains(self) -> None:
-        """Set up LangChain chains using self.llm."""
-        self.job_specific_question_chain = LLMChain(
+    # LangChain chains are built on first use, so agents that never reach an LLM path
+    # (e.g. sessions without a JD/resume) don't pay for them.
+    @cached_property
+    def job_specific_question_chain(self) -> LLMChain:
+        """Chain that generates job-specific questions from the JD and resume."""
+        return LLMChain(
             llm=self.llm,
             prompt=PromptTemplate.from_template(JOB_SPECIFIC_TEMPLATE),
         )
-        
+    
+    @cached_property
+    def next_action_chain(self) -> LLMChain:
+        """Chain that decides the interviewer's next action."""
         # Use time-aware template if using time-based interview
         next_action_template = TIME_AWARE_NEXT_ACTION_TEMPLATE if self.use_time_based_interview else NEXT_ACTION_TEMPLATE
         
-        self.next_action_chain = LLMChain(
+        return LLMChain(
             llm=self.llm,
             prompt=PromptTemplate.from_template(next_action_template),
         )
@@ -207,16 +216,26 @@ TIME AWARENESS:
         
         return questions
     
+    def _get_profile_inputs(self) -> Dict[str, Any]:
+        """
+        Get the chain inputs that only change when the session config does.
+        
+        Returns:
+            Dict of job role, job description, resume, style and difficulty inputs
+        """
+        if self._profile_inputs is None:
+            self._profile_inputs = {
+                "job_role": safe_get_or_default(self.job_role, DEFAULT_VALUE_NOT_PROVIDED),
+                "job_description": safe_get_or_default(self.job_description, DEFAULT_VALUE_NOT_PROVIDED),
+                "resume_content": safe_get_or_default(self.resume_content, DEFAULT_VALUE_NOT_PROVIDED),
+                "interview_style": self.interview_style.value,
+                "difficulty_level": self.difficulty_level
+            }
+        return self._profile_inputs
+    
     def _generate_job_specific_questions(self, num_questions: int) -> List[str]:
         """Generate job-specific questions using LLM."""
-        inputs = {
-            "job_role": safe_get_or_default(self.job_role, DEFAULT_VALUE_NOT_PROVIDED),
-            "job_description": safe_get_or_default(self.job_description, DEFAULT_VALUE_NOT_PROVIDED),
-            "resume_content": safe_get_or_default(self.resume_content, DEFAULT_VALUE_NOT_PROVIDED),
-            "num_questions": num_questions,
-            "difficulty_level": self.difficulty_level,
-            "interview_style": self.interview_style.value
-        }
+        inputs = {**self._get_profile_inputs(), "num_questions": num_questions}
 
         response = invoke_chain_with_error_handling(
             self.job_specific_question_chain,
@@ -298,6 +317,9 @@ TIME AWARENESS:
             elif hasattr(style_value, 'value'):
                 self.interview_style = style_value
         
+        # Config may have changed, so rebuild the cached chain inputs on next use
+        self._profile_inputs = None
+        
         self.logger.info(f"Updated agent config: job_role={self.job_role}, style={self.interview_style.value}, company={self.company_name}, time_based={self.use_time_based_interview}")
 
     def _handle_session_end(self, event: Event) -> None:
@@ -341,11 +363,7 @@ TIME AWARENESS:
         history_str = format_conversation_history(context.conversation_history[:-1])
         
         base_inputs = {
-            "job_role": safe_get_or_default(self.job_role, DEFAULT_VALUE_NOT_PROVIDED),
-            "job_description": safe_get_or_default(self.job_description, DEFAULT_VALUE_NOT_PROVIDED),
-            "resume_content": safe_get_or_default(self.resume_content, DEFAULT_VALUE_NOT_PROVIDED),
-            "interview_style": self.interview_style.value,
-            "difficulty_level": self.difficulty_level,
+            **self._get_profile_inputs(),
             "areas_covered_so_far": self.state.get_covered_topics_str(),
             "conversation_history": history_str,
             "previous_question": self.state.current_question or "[No previous question]",
@@ -394,9 +412,8 @@ TIME AWARENESS:
             return default_action
         
         action_type = response.get("action_type")
-        valid_actions = ["ask_follow_up", "ask_new_question", "end_interview"]
         
-        if action_type not in valid_actions:
+        if action_type not in VALID_INTERVIEW_ACTIONS:
             return default_action
         
         # Time-based interview logic
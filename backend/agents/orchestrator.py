@@ -5,7 +5,12 @@ Session Manager for coordinating agents.
 import logging
 import json
 import asyncio
+import threading
+import time
 import uuid
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import partial
 from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime
 
@@ -18,10 +23,24 @@ from backend.services.llm_service import LLMService
 from backend.services import get_search_service
 from backend.utils.common import get_current_timestamp
 from backend.agents.constants import (
-    ERROR_AGENT_LOAD_FAILED, ERROR_PROCESSING_REQUEST,
-    COACH_FEEDBACK_ERROR, COACH_FEEDBACK_UNAVAILABLE
+    ERROR_AGENT_LOAD_FAILED, ERROR_PROCESSING_REQUEST, ERROR_EMPTY_MESSAGE,
+    COACH_FEEDBACK_ERROR, COACH_FEEDBACK_UNAVAILABLE, COACH_FEEDBACK_PENDING,
+    COACH_FEEDBACK_NOT_GENERATED
 )
 
+# Event factories with the event type and source bound once per publish site
+_EVENT_SOURCE = 'AgentSessionManager'
+_E_SESSION_START = partial(Event, event_type=EventType.SESSION_START, source=_EVENT_SOURCE)
+_E_SESSION_END = partial(Event, event_type=EventType.SESSION_END, source=_EVENT_SOURCE)
+_E_SESSION_RESET = partial(Event, event_type=EventType.SESSION_RESET, source=_EVENT_SOURCE)
+_E_AGENT_LOAD = partial(Event, event_type=EventType.AGENT_LOAD, source=_EVENT_SOURCE)
+_E_USER_MSG = partial(Event, event_type=EventType.USER_MESSAGE, source=_EVENT_SOURCE)
+_E_ASSIST_RESP = partial(Event, event_type=EventType.ASSISTANT_RESPONSE, source=_EVENT_SOURCE)
+_E_ERROR = partial(Event, event_type=EventType.ERROR, source=_EVENT_SOURCE)
+
+# Conversation roles forwarded to the coach as context
+_COACH_HISTORY_ROLES = frozenset({"user", "assistant"})
+
 
 class AgentSessionManager:
     """
@@ -55,14 +74,30 @@ class AgentSessionManager:
         # Initialize conversation and feedback tracking
         self.conversation_history: List[Dict[str, Any]] = []
         self.per_turn_coaching_feedback_log: List[Dict[str, str]] = []
+        self._pending_feedback: List[Future] = []
+        # Per-turn coach feedback runs off the response path on this session's own worker,
+        # one turn at a time as it did inline, so sessions never queue behind each other
+        self._feedback_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"coach-feedback-{self.session_id[:8]}"
+        )
+        # Serializes turns, resets and ends on this session; API handlers run them on worker threads
+        self._session_lock = threading.RLock()
+        self._last_user_message: Optional[str] = None  # None means unknown (e.g. restored history)
         
         # Initialize final summary storage
         self.final_summary: Optional[Dict[str, Any]] = None
+        self._final_summary_message_count: Optional[int] = None  # History length the current summary covers
         self.resource_generation_completed_at: Optional[datetime] = None  # Track when resources are ready for frontend delay
         
         # Initialize agents dictionary
         self._agents: Dict[str, BaseAgent] = {}
         
+        # Child loggers are resolved once; agents may be recreated after a reset
+        self._child_loggers: Dict[str, logging.Logger] = {
+            "interviewer": self.logger.getChild("InterviewerAgent"),
+            "coach": self.logger.getChild("AgenticCoachAgent")
+        }
+        
         # Initialize performance tracking
         self.response_times: List[float] = []
         self.total_response_time = 0.0
@@ -77,25 +112,20 @@ class AgentSessionManager:
                 if hasattr(value, 'value'):  # This is an enum
                     config_dict[key] = value.value
                     
-            self.event_bus.publish(Event(
-                event_type=EventType.SESSION_START, 
-                source='AgentSessionManager', 
+            self.event_bus.publish(_E_SESSION_START(
                 data={"config": config_dict, "session_id": self.session_id}
             ))
     
     def _get_agent(self, agent_type: str) -> Optional[BaseAgent]:
         """Lazy load agents with required dependencies."""
-        if agent_type not in self._agents:
-            agent_instance = self._create_agent(agent_type)
-            if agent_instance:
-                self._agents[agent_type] = agent_instance
-                self.event_bus.publish(Event(
-                    event_type=EventType.AGENT_LOAD, 
-                    source='AgentSessionManager',
-                    data={"agent_type": agent_type}
-                ))
+        agent = self._agents.get(agent_type)
+        if agent is None:
+            agent = self._create_agent(agent_type)
+            if agent:
+                self._agents[agent_type] = agent
+                self.event_bus.publish(_E_AGENT_LOAD(data={"agent_type": agent_type}))
                 
-        return self._agents.get(agent_type)
+        return agent
     
     def _create_agent(self, agent_type: str) -> Optional[BaseAgent]:
         """Create agent instance based on type."""
@@ -105,7 +135,7 @@ class AgentSessionManager:
                 return InterviewerAgent(
                     llm_service=self.llm_service, 
                     event_bus=self.event_bus,
-                    logger=self.logger.getChild("InterviewerAgent"),
+                    logger=self._child_loggers[agent_type],
                     interview_style=self.session_config.style,
                     job_role=self.session_config.job_role,
                     job_description=self.session_config.job_description,
@@ -121,7 +151,7 @@ class AgentSessionManager:
                     llm_service=self.llm_service, 
                     search_service=get_search_service(),
                     event_bus=self.event_bus,
-                    logger=self.logger.getChild("AgenticCoachAgent"),
+                    logger=self._child_loggers[agent_type],
                     resume_content=self.session_config.resume_content,
                     job_description=self.session_config.job_description
                 )
@@ -134,17 +164,32 @@ class AgentSessionManager:
         """
         Processes a user message and returns the agent's response.
         Per-turn coaching feedback is collected internally.
+        An empty message on a fresh session triggers the interviewer introduction;
+        once the conversation has started, blank messages are rejected without
+        touching history, events or agents.
+        Turns on the same session are serialized by the session lock.
         """
+        with self._session_lock:
+            return self._process_message(message)
+
+    def _process_message(self, message: str) -> Dict[str, Any]:
+        """Process one user message; the caller holds the session lock."""
+        history = self.conversation_history
+        if history and (not message or not message.strip()):
+            return self._create_empty_message_response()
+
         start_time = datetime.utcnow()
+        started = time.perf_counter()  # Monotonic clock for the processing duration
 
         # Add user message to history
         user_message_data = self._create_user_message(message, start_time)
-        self.conversation_history.append(user_message_data)
+        history.append(user_message_data)
+        self._last_user_message = message
         self._publish_user_message_event(user_message_data)
 
         try:
             # Get interviewer response
-            interviewer_response = self._get_interviewer_response(start_time)
+            interviewer_response = self._get_interviewer_response(started)
             
             # Generate coaching feedback if applicable
             self._generate_coaching_feedback(user_message_data)
@@ -162,16 +207,21 @@ class AgentSessionManager:
             "timestamp": timestamp.isoformat()
         }
     
+    def _create_empty_message_response(self) -> Dict[str, Any]:
+        """Create the response returned for blank user messages."""
+        return {
+            "role": "system",
+            "content": ERROR_EMPTY_MESSAGE,
+            "timestamp": datetime.utcnow().isoformat(),
+            "error": True
+        }
+    
     def _publish_user_message_event(self, user_message_data: Dict[str, Any]) -> None:
         """Publish user message event."""
-        self.event_bus.publish(Event(
-            event_type=EventType.USER_MESSAGE,
-            source='AgentSessionManager',
-            data={"message": user_message_data}
-        ))
+        self.event_bus.publish(_E_USER_MSG(data={"message": user_message_data}))
     
-    def _get_interviewer_response(self, start_time: datetime) -> Dict[str, Any]:
-        """Get response from interviewer agent."""
+    def _get_interviewer_response(self, started: float) -> Dict[str, Any]:
+        """Get response from interviewer agent; started is the time.perf_counter() reading at message receipt."""
         interviewer_agent = self._get_agent("interviewer")
         if not interviewer_agent:
             raise Exception(ERROR_AGENT_LOAD_FAILED)
@@ -180,8 +230,8 @@ class AgentSessionManager:
         interviewer_response = interviewer_agent.process(agent_context)
         
         # Create response data
+        duration = time.perf_counter() - started
         response_timestamp = datetime.utcnow()
-        duration = (response_timestamp - start_time).total_seconds()
         self.api_call_count += 1
 
         assistant_response_data = {
@@ -201,15 +251,13 @@ class AgentSessionManager:
     
     def _publish_assistant_response_event(self, response_data: Dict[str, Any]) -> None:
         """Publish assistant response event."""
-        self.event_bus.publish(Event(
-            event_type=EventType.ASSISTANT_RESPONSE, 
-            source='AgentSessionManager',
-            data={"response": response_data}
-        ))
+        self.event_bus.publish(_E_ASSIST_RESP(data={"response": response_data}))
     def _generate_coaching_feedback(self, user_message_data: Dict[str, Any]) -> None:
         """
         Collects live feedback from the agentic coach agent if available.
         Operates within the session to log feedback for retrieval.
+        The log entry is reserved immediately (keeping turn order) and filled in by a
+        background worker, so the interviewer response doesn't wait on the coach's LLM call.
         """
         try:
             question = self._find_last_interviewer_question()
@@ -218,8 +266,15 @@ class AgentSessionManager:
             if question and answer:
                 coach_agent = self._get_agent("coach")
                 if coach_agent:
-                    feedback = self._get_coach_feedback(coach_agent, question, answer)
-                    self._log_coach_feedback(question, answer, feedback)
+                    entry = self._log_coach_feedback(question, answer, COACH_FEEDBACK_PENDING)
+                    # Snapshot the history here; the worker must not read it while it grows
+                    filtered_history = self._create_filtered_history_for_coach()
+                    future = self._feedback_executor.submit(
+                        self._fill_coach_feedback, entry, coach_agent, question, answer, filtered_history
+                    )
+                    with self._session_lock:
+                        self._pending_feedback = [f for f in self._pending_feedback if not f.done()]
+                        self._pending_feedback.append(future)
                 else:
                     self._log_coach_feedback_unavailable(question, answer)
         except Exception as e:
@@ -227,17 +282,40 @@ class AgentSessionManager:
 
     def _find_last_interviewer_question(self) -> Optional[str]:
         """Find the most recent question from the interviewer."""
-        for message in reversed(self.conversation_history):
-            if (message.get("role") == "assistant" and
-                    message.get("agent") == "interviewer"):
-                return message.get("content", "")
-        return None
+        last_question = next(
+            (message for message in reversed(self.conversation_history)
+             if message.get("role") == "assistant" and message.get("agent") == "interviewer"),
+            None
+        )
+        return last_question.get("content", "") if last_question is not None else None
+
+    def _fill_coach_feedback(self, entry: Dict[str, str], coach_agent: AgenticCoachAgent,
+                             question: str, answer: str, filtered_history: List[Dict[str, Any]]) -> None:
+        """Generate coach feedback for a reserved log entry (runs on a feedback worker)."""
+        entry["feedback"] = self._get_coach_feedback(coach_agent, question, answer, filtered_history)
+        # The placeholder may already have been saved (e.g. /end timed out waiting), so resave
+        self.needs_database_save = True
 
-    def _get_coach_feedback(self, coach_agent: AgenticCoachAgent, question: str, answer: str) -> str:
+    def wait_for_pending_feedback(self, timeout: Optional[float] = 30.0) -> None:
+        """
+        Block until in-flight per-turn coach feedback has been generated.
+        
+        Args:
+            timeout: Maximum seconds to wait; entries still pending afterwards keep
+                their placeholder text until their worker finishes
+        """
+        # Only hold the lock to snapshot and prune; waiting under it would stall new turns
+        with self._session_lock:
+            pending = list(self._pending_feedback)
+        if pending:
+            wait(pending, timeout=timeout)
+            with self._session_lock:
+                self._pending_feedback = [f for f in self._pending_feedback if not f.done()]
+
+    def _get_coach_feedback(self, coach_agent: AgenticCoachAgent, question: str, answer: str,
+                            filtered_history: List[Dict[str, Any]]) -> str:
         """Get feedback from coach agent for a specific Q&A pair."""
         try:
-            filtered_history = self._create_filtered_history_for_coach()
-            
             # Use the existing evaluate_answer method with the correct parameters
             feedback_response = coach_agent.evaluate_answer(
                 question=question,
@@ -254,26 +332,34 @@ class AgentSessionManager:
 
     def _create_filtered_history_for_coach(self) -> List[Dict[str, Any]]:
         """Create a filtered conversation history for coach agent context."""
-        filtered_history = []
-        for message in self.conversation_history:
-            if message.get("role") in ["user", "assistant"]:
-                filtered_message = {
-                    "role": message["role"],
-                    "content": message.get("content", ""),
-                    "timestamp": message.get("timestamp", "")
-                }
-                if message.get("role") == "assistant":
-                    filtered_message["agent"] = message.get("agent", "unknown")
-                    filtered_history.append(filtered_message)
-        return filtered_history
+        return [
+            self._filter_message_for_coach(message)
+            for message in self.conversation_history
+            if message.get("role") in _COACH_HISTORY_ROLES
+        ]
+
+    @staticmethod
+    def _filter_message_for_coach(message: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce a conversation message to the fields the coach needs."""
+        role = message["role"]
+        filtered_message = {
+            "role": role,
+            "content": message.get("content", ""),
+            "timestamp": message.get("timestamp", "")
+        }
+        if role == "assistant":
+            filtered_message["agent"] = message.get("agent", "unknown")
+        return filtered_message
     
-    def _log_coach_feedback(self, question: str, answer: str, feedback: str) -> None:
-        """Log coaching feedback for later retrieval."""
-        self.per_turn_coaching_feedback_log.append({
+    def _log_coach_feedback(self, question: str, answer: str, feedback: str) -> Dict[str, str]:
+        """Log coaching feedback for later retrieval and return the log entry."""
+        entry = {
             "question": question[:200],
             "answer": answer[:200], 
             "feedback": feedback
-        })
+        }
+        self.per_turn_coaching_feedback_log.append(entry)
+        return entry
     
     def _log_coach_feedback_unavailable(self, question: str, answer: str) -> None:
         """Log when coaching feedback is unavailable."""
@@ -284,9 +370,7 @@ class AgentSessionManager:
         error_message = f"{ERROR_PROCESSING_REQUEST}: {str(error)}"
         self.logger.exception(error_message)
         
-        self.event_bus.publish(Event(
-            event_type=EventType.ERROR,
-            source='AgentSessionManager',
+        self.event_bus.publish(_E_ERROR(
             data={"error": error_message, "session_id": self.session_id}
         ))
         
@@ -304,20 +388,28 @@ class AgentSessionManager:
             conversation_history=self.conversation_history,
             session_config=self.session_config,
             event_bus=self.event_bus,
-            logger=self.logger
+            logger=self.logger,
+            last_user_message=self._last_user_message
         )
 
-    def end_interview(self) -> Dict[str, Any]:
+    def end_interview(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> Dict[str, Any]:
         """
         Ends the interview session and returns consolidated results.
         Starts background generation of final summary while returning per-turn feedback immediately.
+        Call wait_for_pending_feedback first (off the event loop) so the last turns' feedback is complete.
         NOTE: Final summary is NEVER included in this response to ensure frontend polling and loading states.
+        
+        Args:
+            loop: Event loop to run the final summary task on; required when called
+                from a worker thread, defaults to the running loop otherwise
         """
-        self.event_bus.publish(Event(
-            event_type=EventType.SESSION_END,
-            source='AgentSessionManager',
-            data={}
-        ))
+        loop = loop or asyncio.get_running_loop()
+        with self._session_lock:
+            return self._end_interview(loop)
+
+    def _end_interview(self, loop: asyncio.AbstractEventLoop) -> Dict[str, Any]:
+        """End the interview; the caller holds the session lock."""
+        self.event_bus.publish(_E_SESSION_END(data={}))
 
         # Return per-turn feedback immediately, but NEVER include final summary
         final_results = {
@@ -326,11 +418,11 @@ class AgentSessionManager:
             "per_turn_feedback": self.per_turn_coaching_feedback_log
         }
 
-        # Start background generation of final summary
-        if not self.final_summary_generating:
+        # Start background generation of final summary, unless the current one already covers this history
+        if not self.final_summary_generating and not self._final_summary_is_current():
             self.final_summary_generating = True
-            # Start async background task for final summary generation
-            asyncio.create_task(self._generate_final_summary_background())
+            # Start async background task for final summary generation (safe from a worker thread)
+            asyncio.run_coroutine_threadsafe(self._generate_final_summary_background(), loop)
             self.logger.info(f"Started background final summary generation for session {self.session_id}")
 
         # REMOVED: Never include final summary even if already available
@@ -338,6 +430,14 @@ class AgentSessionManager:
 
         return final_results
 
+    def _final_summary_is_current(self) -> bool:
+        """Check whether a successful final summary already covers the current conversation."""
+        return (
+            self._final_summary_message_count == len(self.conversation_history)
+            and isinstance(self.final_summary, dict)
+            and not self.final_summary.get("error")
+        )
+
     async def _generate_final_summary_background(self) -> None:
         """Generate final coaching summary in background async task with enhanced error handling."""
         start_time = datetime.utcnow()
@@ -357,13 +457,18 @@ class AgentSessionManager:
             
             # Step 2: Attempt to generate coaching summary
             self.logger.info("🤖 Invoking agentic coach for final summary generation...", extra=log_context)
-            coaching_summary = self._generate_final_coaching_summary()
+            # Summarize a snapshot and record its length; turns may still land while the coach runs
+            history_snapshot = list(self.conversation_history)
+            summarized_message_count = len(history_snapshot)
+            # The coach call blocks on LLM and search I/O, so keep it off the event loop
+            coaching_summary = await asyncio.to_thread(self._generate_final_coaching_summary, history_snapshot)
             
             generation_time = (datetime.utcnow() - start_time).total_seconds()
             
             # Step 3: Process results
             if coaching_summary:
                 self.final_summary = coaching_summary
+                self._final_summary_message_count = summarized_message_count
                 self.session_status = "completed"
                 # FIXED: Track when resources become available for frontend timing control
                 if isinstance(coaching_summary, dict) and coaching_summary.get('recommended_resources'):
@@ -444,8 +549,8 @@ class AgentSessionManager:
             except Exception as save_flag_error:
                 self.logger.error(f"Failed to set database save flag: {save_flag_error}", extra=log_context)
 
-    def _generate_final_coaching_summary(self) -> Optional[Dict[str, Any]]:
-        """Generate final coaching summary using agentic coach agent with enhanced error handling."""
+    def _generate_final_coaching_summary(self, conversation_history: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Generate final coaching summary for the given history using agentic coach agent with enhanced error handling."""
         session_id = self.session_id
         log_context = {"session_id": session_id}
         
@@ -456,10 +561,10 @@ class AgentSessionManager:
                 self.logger.error("Coach agent not available for final summary generation", extra=log_context)
                 return None
             
-            self.logger.info(f"📚 Coach agent retrieved, generating summary with {len(self.conversation_history)} messages", extra=log_context)
+            self.logger.info(f"📚 Coach agent retrieved, generating summary with {len(conversation_history)} messages", extra=log_context)
             
             # Use the agentic method that includes resource search
-            summary_result = coach_agent.generate_final_summary_with_resources(self.conversation_history)
+            summary_result = coach_agent.generate_final_summary_with_resources(conversation_history)
             
             if summary_result:
                 self.logger.info("✅ Agentic coach completed final summary generation successfully", extra=log_context)
@@ -493,11 +598,13 @@ class AgentSessionManager:
     def get_session_stats(self) -> Dict[str, Any]:
         """Returns performance and usage statistics for the session."""
         avg_response_time = (self.total_response_time / len(self.response_times)) if self.response_times else 0
+        # One pass over the history for all role counts
+        role_counts = Counter(msg.get("role") for msg in self.conversation_history)
         return {
             "total_messages": len(self.conversation_history),
-            "user_messages": sum(1 for msg in self.conversation_history if msg.get("role") == "user"),
-            "assistant_messages": sum(1 for msg in self.conversation_history if msg.get("role") == "assistant"),
-            "system_messages": sum(1 for msg in self.conversation_history if msg.get("role") == "system"),
+            "user_messages": role_counts["user"],
+            "assistant_messages": role_counts["assistant"],
+            "system_messages": role_counts["system"],
             "total_response_time_seconds": round(self.total_response_time, 2),
             "average_response_time_seconds": round(avg_response_time, 2),
             "total_api_calls": self.api_call_count,
@@ -506,9 +613,17 @@ class AgentSessionManager:
 
     def reset_session(self):
         """Resets the session state, including history and agent instances."""
+        with self._session_lock:
+            self._reset_session()
+
+    def _reset_session(self) -> None:
+        """Reset the session state; the caller holds the session lock."""
         self.conversation_history = []
         self.per_turn_coaching_feedback_log = []
+        self._pending_feedback = []  # In-flight workers fill entries of the discarded log
+        self._last_user_message = None
         self.final_summary = None  # CRITICAL FIX: Clear final summary on reset
+        self._final_summary_message_count = None
         self.final_summary_generating = False  # Reset background generation flag
         self.needs_database_save = False  # Reset save flag
         self.resource_generation_completed_at = None  # Reset resource timestamp
@@ -522,7 +637,7 @@ class AgentSessionManager:
         # Reset session status back to active
         self.session_status = "active"
         
-        self.event_bus.publish(Event(event_type=EventType.SESSION_RESET, source='AgentSessionManager', data={}))
+        self.event_bus.publish(_E_SESSION_RESET(data={}))
 
     @classmethod
     def from_session_data(cls, session_data: Dict, llm_service: LLMService, 
@@ -555,6 +670,10 @@ class AgentSessionManager:
         # Restore state from database
         manager.conversation_history = session_data.get("conversation_history", [])
         manager.per_turn_coaching_feedback_log = session_data.get("per_turn_feedback_log", [])
+        # Workers that were filling pending entries didn't survive the restore, so those turns never will be
+        for entry in manager.per_turn_coaching_feedback_log:
+            if entry.get("feedback") == COACH_FEEDBACK_PENDING:
+                entry["feedback"] = COACH_FEEDBACK_NOT_GENERATED
         manager.final_summary = session_data.get("final_summary")  # CRITICAL FIX: Restore final summary from database
         manager.final_summary_generating = session_data.get("final_summary_generating", False)  # Restore generation flag
         manager.needs_database_save = session_data.get("needs_database_save", False)  # Restore save flag
@@ -5,13 +5,52 @@ Provides intelligent search capabilities for finding educational resources.
 
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, List, Dict, Any, Optional, TypeVar
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
 from backend.services.search_service import SearchService, Resource
 from backend.services.search_config import BOOK_DOMAINS
 
+T = TypeVar("T")
+
+# Title words that mark a resource as paid content
+PAID_INDICATORS = ("buy", "purchase", "paid", "premium", "subscription", "kindle", "paperback")
+
+# Longest a synchronous caller waits for a search before giving up
+SYNC_SEARCH_TIMEOUT_SECONDS = 30
+
+# Runs sync searches requested from inside an event loop, where asyncio.run can't be used directly
+_SYNC_SEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="search-tool")
+
+
+def run_search_sync(search: Awaitable[T], timeout: float = SYNC_SEARCH_TIMEOUT_SECONDS) -> T:
+    """
+    Run a search coroutine to completion from synchronous code.
+    
+    Args:
+        search: The coroutine to run
+        timeout: Seconds to wait for the search before giving up
+        
+    Returns:
+        The coroutine's result
+        
+    Raises:
+        TimeoutError: If the search doesn't finish within the timeout
+    """
+    # Bounding the search on its own loop cancels it, so a stuck provider doesn't hold a worker
+    bounded_search = asyncio.wait_for(search, timeout)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # No running loop, safe to create one
+        return asyncio.run(bounded_search)
+    
+    # We're in an async context; run the search on its own loop in a shared worker thread.
+    # This blocks the caller's loop, so the wait is capped even if the worker is queued.
+    return _SYNC_SEARCH_EXECUTOR.submit(asyncio.run, bounded_search).result(timeout=timeout)
+
 
 class SearchInput(BaseModel):
     """Input schema for the learning resource search tool."""
@@ -89,16 +128,15 @@ class LearningResourceSearchTool(BaseTool):
             is_book_domain = any(domain in url_lower for domain in BOOK_DOMAINS)
             
             if is_book_domain:
-                self.logger.debug(f"Filtering out book resource: {resource.title}")
+                self.logger.debug("Filtering out book resource: %s", resource.title)
                 continue
             
             # Skip titles that indicate paid content
             title_lower = resource.title.lower()
-            paid_indicators = ["buy", "purchase", "paid", "premium", "subscription", "kindle", "paperback"]
-            has_paid_indicator = any(indicator in title_lower for indicator in paid_indicators)
+            has_paid_indicator = any(indicator in title_lower for indicator in PAID_INDICATORS)
             
             if has_paid_indicator:
-                self.logger.debug(f"Filtering out paid resource: {resource.title}")
+                self.logger.debug("Filtering out paid resource: %s", resource.title)
                 continue
             
             # Keep the resource if it passes filters
@@ -115,44 +153,10 @@ class LearningResourceSearchTool(BaseTool):
             String representation of search results for the LLM
         """
         try:
-            # Check if we're in an async context
-            try:
-                loop = asyncio.get_running_loop()
-                # We're in an async context - create a task and wait for it
-                import concurrent.futures
-                import threading
-                
-                # Create a future to hold the result
-                future = concurrent.futures.Future()
-                
-                def run_async_search():
-                    """Run the async search in a separate thread with its own event loop"""
-                    try:
-                        # Create new event loop for this thread
-                        new_loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(new_loop)
-                        try:
-                            result = new_loop.run_until_complete(
-                                self._perform_search(skill, proficiency_level, job_role, num_results)
-                            )
-                            future.set_result(result)
-                        finally:
-                            new_loop.close()
-                    except Exception as e:
-                        future.set_exception(e)
-                
-                # Run in a separate thread to avoid event loop conflicts
-                thread = threading.Thread(target=run_async_search)
-                thread.start()
-                thread.join()
-                
-                # Get the result
-                return future.result()
-                
-            except RuntimeError:
-                # No running loop, safe to create one
-                return asyncio.run(self._perform_search(skill, proficiency_level, job_role, num_results))
-            
+            return run_search_sync(self._perform_search(skill, proficiency_level, job_role, num_results))
+        except TimeoutError:
+            self.logger.error(f"Sync search tool timed out after {SYNC_SEARCH_TIMEOUT_SECONDS}s")
+            return f"Search failed: timed out after {SYNC_SEARCH_TIMEOUT_SECONDS} seconds"
         except Exception as e:
             self.logger.error(f"Error in sync search tool: {e}")
             return f"Search failed: {str(e)}"
@@ -180,29 +184,42 @@ class LearningResourceSearchTool(BaseTool):
             Formatted search results for LLM
         """
         try:
-            # Search for significantly more results than needed since we'll filter
-            search_count = min(num_results * 4, 40)  # Get 4x more to account for filtering
-            
-            all_resources = await self.search_service.search_resources(
-                skill=skill,
-                proficiency_level=proficiency_level,
-                job_role=job_role,
-                num_results=search_count,
-                use_cache=True
-            )
-            
-            # Filter out paid content
-            free_resources = self._filter_free_resources(all_resources)
-            
-            # Return top results, ensuring we try to meet the requested number
-            final_resources = free_resources[:num_results]
-            
+            final_resources = await self.find_free_resources(skill, proficiency_level, job_role, num_results)
             return self._format_results_for_llm(final_resources, skill)
             
         except Exception as e:
             self.logger.error(f"Error in search operation: {e}")
             return f"Search failed for '{skill}': {str(e)}"
     
+    async def find_free_resources(self, skill: str, proficiency_level: str = "intermediate",
+                                  job_role: Optional[str] = None, num_results: int = 5) -> List[Resource]:
+        """
+        Search for free learning resources and return them as Resource objects.
+        Use this from code; the text returned by _run/_arun is meant for LLM consumption.
+        
+        Args:
+            skill: The skill or topic to search for
+            proficiency_level: The user's proficiency level
+            job_role: Optional job role context
+            num_results: Maximum number of resources to return
+            
+        Returns:
+            Up to num_results free resources, best first
+        """
+        # Search for significantly more results than needed since we'll filter
+        search_count = min(num_results * 4, 40)  # Get 4x more to account for filtering
+        
+        all_resources = await self.search_service.search_resources(
+            skill=skill,
+            proficiency_level=proficiency_level,
+            job_role=job_role,
+            num_results=search_count,
+            use_cache=True
+        )
+        
+        # Filter out paid content, then return top results, ensuring we try to meet the requested number
+        return self._filter_free_resources(all_resources)[:num_results]
+    
     def _format_results_for_llm(self, resources: List[Resource], skill: str) -> str:
         """
         Format search results in a way the LLM can understand and use.
@@ -217,20 +234,23 @@ class LearningResourceSearchTool(BaseTool):
         if not resources:
             return f"No suitable free learning resources found for '{skill}'. You may want to suggest the user search for more general terms or foundational concepts."
         
-        result_text = f"Found {len(resources)} free learning resources for '{skill}':\n\n"
+        # Collect the pieces and join once instead of growing a string per line
+        parts = [f"Found {len(resources)} free learning resources for '{skill}':\n\n"]
         
         for i, resource in enumerate(resources, 1):
-            result_text += f"{i}. **{resource.title}**\n"
-            result_text += f"   Type: {resource.resource_type}\n"
-            result_text += f"   URL: {resource.url}\n"
-            result_text += f"   Description: {resource.description}\n"
-            result_text += f"   Relevance Score: {resource.relevance_score:.2f}\n"
+            parts.append(
+                f"{i}. **{resource.title}**\n"
+                f"   Type: {resource.resource_type}\n"
+                f"   URL: {resource.url}\n"
+                f"   Description: {resource.description}\n"
+                f"   Relevance Score: {resource.relevance_score:.2f}\n"
+            )
             
             if resource.metadata:
                 domain_quality = resource.metadata.get('domain_quality', 'unknown')
-                result_text += f"   Domain Quality: {domain_quality}\n"
+                parts.append(f"   Domain Quality: {domain_quality}\n")
             
-            result_text += "\n"
+            parts.append("\n")
         
-        result_text += "\nAll resources have been filtered to exclude paid content, books, and premium services."
-        return result_text 
\ No newline at end of file
+        parts.append("\nAll resources have been filtered to exclude paid content, books, and premium services.")
+        return "".join(parts) 
\ No newline at end of file
@@ -207,13 +207,14 @@ def create_agent_api(app):
             session_manager.session_config = new_config
             logger.info(f"Updated session config: {new_config.dict()}")
 
-            # Reset the session state
-            session_manager.reset_session()
+            # Reset the session state (waits for any in-flight turn, so keep it off the event loop)
+            await asyncio.to_thread(session_manager.reset_session)
             logger.info("Session state reset.")
 
             # Get the initial introduction message from the interviewer agent
-            # Pass empty message to trigger initialization/introduction phase
-            initial_response = session_manager.process_message(message="")
+            # Pass empty message to trigger initialization/introduction phase.
+            # The LLM call blocks, so run it off the event loop.
+            initial_response = await asyncio.to_thread(session_manager.process_message, message="")
             logger.info(f"Generated initial introduction for session {session_manager.session_id}")
             
             # FIXED: Make database save non-blocking to improve response time
@@ -246,7 +247,10 @@ def create_agent_api(app):
         user_email = current_user["email"] if current_user else "anonymous"
         logger.info(f"Session {session_manager.session_id} received message from {user_email}: '{user_input.message[:50]}...'")
         try:
-            interviewer_response_dict = session_manager.process_message(message=user_input.message)
+            # The LLM call blocks, so run it off the event loop to keep other sessions responsive
+            interviewer_response_dict = await asyncio.to_thread(
+                session_manager.process_message, message=user_input.message
+            )
             logger.info(f"Session {session_manager.session_id} generated response")
             
             # FIXED: Make database save non-blocking to improve response time
@@ -272,7 +276,12 @@ def create_agent_api(app):
         user_email = current_user["email"] if current_user else "anonymous"
         logger.info(f"Ending session {session_manager.session_id} for user: {user_email}")
         try:
-            final_session_results = session_manager.end_interview()
+            # Let in-flight per-turn coach feedback finish so the last answers are included
+            await asyncio.to_thread(session_manager.wait_for_pending_feedback)
+            # end_interview takes the session lock, so run it off the event loop too
+            final_session_results = await asyncio.to_thread(
+                session_manager.end_interview, asyncio.get_running_loop()
+            )
             logger.info(f"Session {session_manager.session_id} ended with results")
 
             # FIXED: Make database save non-blocking to improve response time
@@ -470,7 +479,7 @@ def create_agent_api(app):
         user_email = current_user["email"] if current_user else "anonymous"
         logger.info(f"Resetting session {session_manager.session_id} for user: {user_email}")
         try:
-            session_manager.reset_session()
+            await asyncio.to_thread(session_manager.reset_session)
             logger.info(f"Session {session_manager.session_id} reset")
 
             # FIXED: Make database save non-blocking to improve response time
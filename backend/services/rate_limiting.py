@@ -5,6 +5,7 @@ Provides semaphore-based limiting for AssemblyAI, Polly, Deepgram, and Search AP
 
 import asyncio
 import logging
+import threading
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 from backend.config import get_logger
@@ -29,7 +30,10 @@ class APIRateLimiter:
         self.assemblyai_semaphore = asyncio.Semaphore(self.assemblyai_limit)
         self.polly_semaphore = asyncio.Semaphore(self.polly_limit)
         self.deepgram_semaphore = asyncio.Semaphore(self.deepgram_limit)
-        self.search_semaphore = asyncio.Semaphore(self.search_limit)
+        # Searches run on several event loops (request loop, coach/tool worker loops), and an
+        # asyncio.Semaphore only works on one loop, so the search gate is a thread semaphore
+        self.search_semaphore = threading.BoundedSemaphore(self.search_limit)
+        self._search_stats_lock = threading.Lock()
         
         # Rate limiting metrics
         self.api_usage_stats = {
@@ -146,25 +150,31 @@ class APIRateLimiter:
         """
         try:
             # Use timeout to prevent indefinite hanging in production
-            await asyncio.wait_for(self.search_semaphore.acquire(), timeout=5.0)
-            self.api_usage_stats['search']['active'] += 1
-            self.api_usage_stats['search']['total_requests'] += 1
-            logger.debug(f"Search slot acquired. Active: {self.api_usage_stats['search']['active']}")
-            return True
-        except asyncio.TimeoutError:
-            logger.warning("Search service unavailable - all slots occupied")
-            self.api_usage_stats['search']['errors'] += 1
-            return False
+            acquired = await _acquire_thread_semaphore(self.search_semaphore, timeout=5.0)
         except Exception as e:
             logger.error(f"Failed to acquire Search slot: {e}")
-            self.api_usage_stats['search']['errors'] += 1
+            with self._search_stats_lock:
+                self.api_usage_stats['search']['errors'] += 1
             return False
+        
+        with self._search_stats_lock:
+            if not acquired:
+                self.api_usage_stats['search']['errors'] += 1
+            else:
+                self.api_usage_stats['search']['active'] += 1
+                self.api_usage_stats['search']['total_requests'] += 1
+        if not acquired:
+            logger.warning("Search service unavailable - all slots occupied")
+            return False
+        logger.debug(f"Search slot acquired. Active: {self.api_usage_stats['search']['active']}")
+        return True
     
     def release_search(self):
         """Release Search API slot."""
         try:
             self.search_semaphore.release()
-            self.api_usage_stats['search']['active'] -= 1
+            with self._search_stats_lock:
+                self.api_usage_stats['search']['active'] -= 1
             logger.debug(f"Search slot released. Active: {self.api_usage_stats['search']['active']}")
         except Exception as e:
             logger.error(f"Failed to release Search slot: {e}")
@@ -225,6 +235,44 @@ class APIRateLimiter:
             return False
 
 
+async def _acquire_thread_semaphore(semaphore: threading.Semaphore, timeout: float) -> bool:
+    """
+    Acquire a thread semaphore from async code without blocking the event loop.
+    
+    Args:
+        semaphore: Semaphore shared across threads and event loops
+        timeout: Maximum seconds to wait for a slot
+        
+    Returns:
+        bool: True if a slot was acquired (the caller must release it)
+    """
+    if semaphore.acquire(blocking=False):
+        return True
+    
+    # Wait in a worker thread; if the caller is cancelled meanwhile, a slot the worker
+    # still obtains is handed straight back instead of leaking
+    state_lock = threading.Lock()
+    state = {"abandoned": False, "acquired": False}
+    
+    def wait_for_slot() -> bool:
+        acquired = semaphore.acquire(timeout=timeout)
+        with state_lock:
+            if acquired and state["abandoned"]:
+                semaphore.release()
+                return False
+            state["acquired"] = acquired
+        return acquired
+    
+    try:
+        return await asyncio.to_thread(wait_for_slot)
+    except asyncio.CancelledError:
+        with state_lock:
+            state["abandoned"] = True
+            if state["acquired"]:
+                semaphore.release()
+        raise
+
+
 # Global rate limiter instance
 _rate_limiter: Optional[APIRateLimiter] = None
 
@@ -3,7 +3,8 @@ Helper classes for search service functionality.
 Extracts the resource classification and relevance scoring logic.
 """
 
-from typing import Optional
+import re
+from typing import Iterable, Optional
 from .search_config import (
     COURSE_DOMAINS, VIDEO_DOMAINS, DOCUMENTATION_DOMAINS, COMMUNITY_DOMAINS, BOOK_DOMAINS,
     COURSE_INDICATORS, VIDEO_INDICATORS, DOCUMENTATION_INDICATORS, 
@@ -13,6 +14,11 @@ from .search_config import (
 )
 
 
+def _compile_literals(literals: Iterable[str]) -> "re.Pattern[str]":
+    """Compile literal substrings into one pattern that matches if any of them occurs."""
+    return re.compile("|".join(re.escape(literal) for literal in sorted(literals)))
+
+
 class ResourceType:
     """Resource type constants."""
     ARTICLE = "article"
@@ -29,6 +35,17 @@ class ResourceType:
 class ResourceClassifier:
     """Handles resource type classification based on content and URL."""
     
+    # (type, title pattern, url pattern) in priority order; each indicator/domain
+    # set is compiled once so a check is a single scan of the text
+    _RULES = (
+        (ResourceType.COURSE, _compile_literals(COURSE_INDICATORS), _compile_literals(COURSE_DOMAINS)),
+        (ResourceType.VIDEO, _compile_literals(VIDEO_INDICATORS), _compile_literals(VIDEO_DOMAINS)),
+        (ResourceType.DOCUMENTATION, _compile_literals(DOCUMENTATION_INDICATORS), _compile_literals(DOCUMENTATION_DOMAINS)),
+        (ResourceType.TUTORIAL, _compile_literals(TUTORIAL_INDICATORS), None),
+        (ResourceType.COMMUNITY, _compile_literals(COMMUNITY_INDICATORS), _compile_literals(COMMUNITY_DOMAINS)),
+        (ResourceType.BOOK, _compile_literals(BOOK_INDICATORS), _compile_literals(BOOK_DOMAINS)),
+    )
+    
     @staticmethod
     def classify(title: str, url: str, description: str) -> str:
         """
@@ -45,47 +62,13 @@ class ResourceClassifier:
         title_lower = title.lower()
         url_lower = url.lower()
         
-        # Check courses first (highest priority)
-        if ResourceClassifier._matches_patterns(title_lower, COURSE_INDICATORS) or \
-           ResourceClassifier._matches_domains(url_lower, COURSE_DOMAINS):
-            return ResourceType.COURSE
-        
-        # Check videos
-        if ResourceClassifier._matches_patterns(title_lower, VIDEO_INDICATORS) or \
-           ResourceClassifier._matches_domains(url_lower, VIDEO_DOMAINS):
-            return ResourceType.VIDEO
-        
-        # Check documentation
-        if ResourceClassifier._matches_patterns(title_lower, DOCUMENTATION_INDICATORS) or \
-           ResourceClassifier._matches_domains(url_lower, DOCUMENTATION_DOMAINS):
-            return ResourceType.DOCUMENTATION
-        
-        # Check tutorials
-        if ResourceClassifier._matches_patterns(title_lower, TUTORIAL_INDICATORS):
-            return ResourceType.TUTORIAL
-        
-        # Check communities
-        if ResourceClassifier._matches_patterns(title_lower, COMMUNITY_INDICATORS) or \
-           ResourceClassifier._matches_domains(url_lower, COMMUNITY_DOMAINS):
-            return ResourceType.COMMUNITY
-        
-        # Check books
-        if ResourceClassifier._matches_patterns(title_lower, BOOK_INDICATORS) or \
-           ResourceClassifier._matches_domains(url_lower, BOOK_DOMAINS):
-            return ResourceType.BOOK
+        # First matching rule wins (courses have the highest priority)
+        for resource_type, title_pattern, url_pattern in ResourceClassifier._RULES:
+            if title_pattern.search(title_lower) or (url_pattern and url_pattern.search(url_lower)):
+                return resource_type
         
         # Default to article
         return ResourceType.ARTICLE
-    
-    @staticmethod
-    def _matches_patterns(text: str, patterns: set) -> bool:
-        """Check if text contains any of the patterns."""
-        return any(pattern in text for pattern in patterns)
-    
-    @staticmethod 
-    def _matches_domains(url: str, domains: set) -> bool:
-        """Check if URL contains any of the domains."""
-        return any(domain in url for domain in domains)
 
 
 class RelevanceScorer:
@@ -117,26 +100,58 @@ class RelevanceScorer:
         Returns:
             Relevance score (0.0 to 1.0)
         """
-        score = 0.0
+        return self.calculate_normalized_score(
+            title.lower(),
+            url.lower(),
+            description.lower(),
+            skill.lower(),
+            proficiency_level.lower(),
+            job_role.lower() if job_role else None
+        )
+    
+    def calculate_normalized_score(
+        self,
+        title_lower: str,
+        url_lower: str,
+        description_lower: str,
+        skill_lower: str,
+        level_lower: str,
+        job_role_lower: Optional[str] = None,
+        domain_quality: Optional[float] = None
+    ) -> float:
+        """
+        Calculate relevance score from already-lowercased inputs.
         
-        # Prepare text for matching
-        title_lower = title.lower()
-        url_lower = url.lower()
-        description_lower = description.lower()
-        skill_lower = skill.lower()
+        Lets callers scoring a whole result page lowercase the search
+        context once and reuse a domain quality score they already computed.
+        
+        Args:
+            title_lower: Lowercased resource title
+            url_lower: Lowercased resource URL
+            description_lower: Lowercased resource description
+            skill_lower: Lowercased skill being searched
+            level_lower: Lowercased proficiency level
+            job_role_lower: Optional lowercased job role context
+            domain_quality: Optional precomputed domain quality score
+            
+        Returns:
+            Relevance score (0.0 to 1.0)
+        """
+        score = 0.0
         
         # Skill matching
         score += self._calculate_skill_score(title_lower, url_lower, description_lower, skill_lower)
         
         # Proficiency level matching
-        score += self._calculate_level_score(title_lower, description_lower, proficiency_level)
+        score += self._calculate_level_score(title_lower, description_lower, level_lower)
         
         # Job role matching
-        if job_role:
-            score += self._calculate_job_role_score(title_lower, description_lower, job_role)
+        if job_role_lower:
+            score += self._calculate_job_role_score(title_lower, description_lower, job_role_lower)
         
         # Domain quality bonus
-        domain_quality = DomainQualityEvaluator.get_quality_score(url_lower)
+        if domain_quality is None:
+            domain_quality = DomainQualityEvaluator.get_quality_score(url_lower)
         score += domain_quality * self.weights["domain_quality_multiplier"]
         
         # Cap score at 1.0
@@ -157,14 +172,12 @@ class RelevanceScorer:
         
         return score
     
-    def _calculate_level_score(self, title: str, description: str, proficiency_level: str) -> float:
-        """Calculate score based on proficiency level."""
-        level = proficiency_level.lower()
-        if level not in PROFICIENCY_LEVEL_TERMS:
+    def _calculate_level_score(self, title: str, description: str, level: str) -> float:
+        """Calculate score based on (lowercased) proficiency level."""
+        level_terms = PROFICIENCY_LEVEL_TERMS.get(level)
+        if not level_terms:
             return 0.0
         
-        level_terms = PROFICIENCY_LEVEL_TERMS[level]
-        
         # Check title first (higher weight)
         for term in level_terms:
             if term in title:
@@ -178,12 +191,10 @@ class RelevanceScorer:
         return 0.0
     
     def _calculate_job_role_score(self, title: str, description: str, job_role: str) -> float:
-        """Calculate score based on job role presence."""
-        job_role_lower = job_role.lower()
-        
-        if job_role_lower in title:
+        """Calculate score based on (lowercased) job role presence."""
+        if job_role in title:
             return self.weights["job_role_in_title"]
-        elif job_role_lower in description:
+        elif job_role in description:
             return self.weights["job_role_in_description"]
         
         return 0.0
@@ -192,6 +203,10 @@ class RelevanceScorer:
 class DomainQualityEvaluator:
     """Evaluates domain quality for scoring purposes."""
     
+    # One compiled alternation per tier keeps "top beats medium" while scanning the URL once per tier
+    _TOP_DOMAINS = _compile_literals(TOP_QUALITY_DOMAINS)
+    _MEDIUM_DOMAINS = _compile_literals(MEDIUM_QUALITY_DOMAINS)
+    
     @staticmethod
     def get_quality_score(url: str) -> float:
         """
@@ -204,14 +219,12 @@ class DomainQualityEvaluator:
             Domain quality score (0.0 to 1.0)
         """
         # Check top quality domains first
-        for domain in TOP_QUALITY_DOMAINS:
-            if domain in url:
-                return DOMAIN_QUALITY_SCORES["top"]
+        if DomainQualityEvaluator._TOP_DOMAINS.search(url):
+            return DOMAIN_QUALITY_SCORES["top"]
         
         # Check medium quality domains
-        for domain in MEDIUM_QUALITY_DOMAINS:
-            if domain in url:
-                return DOMAIN_QUALITY_SCORES["medium"]
+        if DomainQualityEvaluator._MEDIUM_DOMAINS.search(url):
+            return DOMAIN_QUALITY_SCORES["medium"]
         
         # Return default score for unknown domains
         return DOMAIN_QUALITY_SCORES["default"]
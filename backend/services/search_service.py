@@ -7,8 +7,11 @@ import os
 import json
 import logging
 import time
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
 from typing import Dict, Any, List, Optional, Tuple
-from datetime import datetime, timedelta
 import httpx
 from dotenv import load_dotenv
 import backoff 
@@ -24,6 +27,13 @@ load_dotenv()
 DEFAULT_SEARCH_PROVIDER = "serper"
 SERPER_KEY = os.environ.get("SERPER_API_KEY", "")
 SEARCH_CACHE_TTL = 3600 
+SEARCH_CACHE_MAX_ENTRIES = 256  # Least recently used entries are evicted beyond this
+
+
+def _cache_clock() -> float:
+    """Clock used for cache entry ages (module-level so tests can replace it)."""
+    return time.monotonic()
+
 
 class SearchProvider:
     """Base class for search providers."""
@@ -104,6 +114,12 @@ class SerperProvider(SearchProvider):
 class Resource:
     """Resource class for representing a learning resource."""
     
+    # Many resources are built per search and cached, so skip the per-instance dict
+    __slots__ = (
+        "title", "url", "description", "resource_type",
+        "source", "relevance_score", "metadata"
+    )
+    
     def __init__(
         self,
         title: str,
@@ -161,9 +177,17 @@ class SearchService:
         self.classifier = ResourceClassifier()
         self.relevance_scorer = RelevanceScorer()
         
-        # Initialize cache
-        self._search_cache = {}
-        self._search_cache_timestamps = {}
+        # Initialize cache: key -> (monotonic timestamp, resources), oldest use first
+        self._search_cache: "OrderedDict[str, Tuple[float, List[Resource]]]" = OrderedDict()
+        # The service is a process-wide singleton used from several threads, so every
+        # cache read, write and eviction happens under this lock
+        self._cache_lock = threading.Lock()
+        
+        # Searches currently running, so identical concurrent requests share one provider call.
+        # Callers may run on different threads/event loops (see LearningResourceSearchTool),
+        # hence thread-safe futures guarded by a lock.
+        self._inflight_searches: Dict[str, "Future[List[Resource]]"] = {}
+        self._inflight_lock = threading.Lock()
         
         self.logger.info("Initialized search service with helper components and rate limiting")
     
@@ -190,16 +214,125 @@ class SearchService:
         """
         # Generate search query
         query = self._generate_query(skill, proficiency_level, job_role)
-        cache_key = f"{query}_{num_results}"
+        cache_key = self._make_cache_key(query, num_results)
         
-        # Check cache
-        now = datetime.utcnow()
-        if use_cache and cache_key in self._search_cache:
-            cache_time = self._search_cache_timestamps.get(cache_key)
-            if cache_time and (now - cache_time).total_seconds() < SEARCH_CACHE_TTL:
-                self.logger.debug(f"Using cached search results for: {query}")
-                return self._search_cache[cache_key]
+        now = _cache_clock()
+        if not use_cache:
+            return await self._search_and_cache(
+                query, cache_key, skill, proficiency_level, job_role, num_results, use_cache, now
+            )
         
+        while True:
+            # Check cache
+            cached_resources = self._get_cached(cache_key, now)
+            if cached_resources is not None:
+                self.logger.debug("Using cached search results for: %s", query)
+                return cached_resources
+            
+            # Join an identical search that is already running instead of repeating it
+            with self._inflight_lock:
+                in_flight = self._inflight_searches.get(cache_key)
+                is_owner = in_flight is None
+                if is_owner:
+                    in_flight = self._inflight_searches[cache_key] = Future()
+            
+            if is_owner:
+                return await self._run_inflight_search(
+                    in_flight, query, cache_key, skill, proficiency_level, job_role, num_results, use_cache, now
+                )
+            
+            self.logger.debug("Waiting for in-flight search: %s", query)
+            try:
+                # Shield so cancelling this caller doesn't cancel the shared search
+                return await asyncio.shield(asyncio.wrap_future(in_flight))
+            except asyncio.CancelledError:
+                if not in_flight.cancelled():
+                    raise  # This caller was cancelled
+                # The owner was cancelled and dropped its entry; retry (possibly as the new owner)
+                now = _cache_clock()
+    
+    async def _run_inflight_search(
+        self,
+        in_flight: "Future[List[Resource]]",
+        query: str,
+        cache_key: str,
+        skill: str,
+        proficiency_level: str,
+        job_role: Optional[str],
+        num_results: int,
+        use_cache: bool,
+        now: float
+    ) -> List[Resource]:
+        """
+        Run a search as the owner of its in-flight entry and publish the outcome to joiners.
+        
+        Args:
+            in_flight: Future shared with callers joining this search
+            query: Generated search query
+            cache_key: Cache key for the search
+            skill: Skill being searched
+            proficiency_level: Proficiency level
+            job_role: Optional job role context
+            num_results: Number of results to return
+            use_cache: Whether to cache the results
+            now: Monotonic time the search was requested
+            
+        Returns:
+            List of resources
+        """
+        try:
+            resources = await self._search_and_cache(
+                query, cache_key, skill, proficiency_level, job_role, num_results, use_cache, now
+            )
+        except asyncio.CancelledError:
+            # Don't hand our cancellation to joiners; drop the entry so they retry
+            self._release_inflight(cache_key, in_flight)
+            in_flight.cancel()
+            raise
+        except BaseException as e:
+            self._release_inflight(cache_key, in_flight)
+            if not in_flight.done():
+                in_flight.set_exception(e)
+            raise
+        
+        self._release_inflight(cache_key, in_flight)
+        if not in_flight.done():
+            in_flight.set_result(resources)
+        return resources
+    
+    def _release_inflight(self, cache_key: str, in_flight: "Future[List[Resource]]") -> None:
+        """Remove an in-flight entry, if it is still the one registered for the key."""
+        with self._inflight_lock:
+            if self._inflight_searches.get(cache_key) is in_flight:
+                del self._inflight_searches[cache_key]
+    
+    async def _search_and_cache(
+        self,
+        query: str,
+        cache_key: str,
+        skill: str,
+        proficiency_level: str,
+        job_role: Optional[str],
+        num_results: int,
+        use_cache: bool,
+        now: float
+    ) -> List[Resource]:
+        """
+        Query the search provider, process and cache its results, falling back on failure.
+        
+        Args:
+            query: Generated search query
+            cache_key: Cache key for the search
+            skill: Skill to search for
+            proficiency_level: Proficiency level
+            job_role: Optional job role context
+            num_results: Number of results to return
+            use_cache: Whether to cache the results
+            now: Monotonic time the search started
+            
+        Returns:
+            List of resources
+        """
         try:
             # Perform search
             self.logger.info(f"Searching for resources: {query}")
@@ -216,8 +349,7 @@ class SearchService:
             
             # Cache results
             if use_cache:
-                self._search_cache[cache_key] = resources
-                self._search_cache_timestamps[cache_key] = now
+                self._store_cached(cache_key, resources, now)
             
             self.logger.info(f"Found {len(resources)} processed resources for: {query}")
             
@@ -236,6 +368,62 @@ class SearchService:
             self.logger.info(f"Generated {len(fallback_resources)} fallback resources")
             return fallback_resources
     
+    @staticmethod
+    def _make_cache_key(query: str, num_results: int) -> str:
+        """
+        Build a cache key that ignores case and spacing differences in the query.
+        
+        Skills often arrive from LLM output as "Python", "python " and so on; the
+        search provider and relevance scoring are case-insensitive, so these share results.
+        
+        Args:
+            query: Generated search query
+            num_results: Number of results requested
+            
+        Returns:
+            Normalized cache key
+        """
+        return f"{' '.join(query.lower().split())}_{num_results}"
+    
+    def _get_cached(self, cache_key: str, now: float) -> Optional[List[Resource]]:
+        """
+        Get fresh cached resources and mark them as recently used.
+        
+        Args:
+            cache_key: Cache key for the search
+            now: Current monotonic time
+            
+        Returns:
+            Cached resources, or None on a miss or expired entry
+        """
+        with self._cache_lock:
+            entry = self._search_cache.get(cache_key)
+            if entry is None:
+                return None
+            
+            cache_time, resources = entry
+            if now - cache_time >= SEARCH_CACHE_TTL:
+                del self._search_cache[cache_key]
+                return None
+            
+            self._search_cache.move_to_end(cache_key)
+            return resources
+    
+    def _store_cached(self, cache_key: str, resources: List[Resource], now: float) -> None:
+        """
+        Cache resources, evicting the least recently used entries beyond the size limit.
+        
+        Args:
+            cache_key: Cache key for the search
+            resources: Resources to cache
+            now: Current monotonic time
+        """
+        with self._cache_lock:
+            self._search_cache[cache_key] = (now, resources)
+            self._search_cache.move_to_end(cache_key)
+            while len(self._search_cache) > SEARCH_CACHE_MAX_ENTRIES:
+                self._search_cache.popitem(last=False)
+    
     def _generate_query(
         self,
         skill: str,
@@ -288,6 +476,11 @@ class SearchService:
         """
         resources = []
         
+        # Lowercase the search context once rather than per result
+        skill_lower = skill.lower()
+        level_lower = proficiency_level.lower()
+        job_role_lower = job_role.lower() if job_role else None
+        
         # Process organic results
         organic_results = search_results.get("organic", [])
         
@@ -303,9 +496,14 @@ class SearchService:
                 # Classify resource type
                 resource_type = self.classifier.classify(title, url, description)
                 
+                # Domain quality feeds both the score and the metadata
+                url_lower = url.lower()
+                domain_quality = DomainQualityEvaluator.get_quality_score(url_lower)
+                
                 # Calculate relevance score
-                relevance_score = self.relevance_scorer.calculate_score(
-                    title, url, description, skill, proficiency_level, job_role
+                relevance_score = self.relevance_scorer.calculate_normalized_score(
+                    title.lower(), url_lower, description.lower(),
+                    skill_lower, level_lower, job_role_lower, domain_quality
                 )
                 
                 # Create resource
@@ -318,7 +516,7 @@ class SearchService:
                     relevance_score=relevance_score,
                     metadata={
                         "search_rank": len(resources),
-                        "domain_quality": DomainQualityEvaluator.get_quality_score(url)
+                        "domain_quality": domain_quality
                     }
                 )
                 
@@ -335,6 +533,6 @@ class SearchService:
     
     def clear_cache(self) -> None:
         """Clear the search cache."""
-        self._search_cache = {}
-        self._search_cache_timestamps = {}
+        with self._cache_lock:
+            self._search_cache.clear()
         self.logger.info("Search cache cleared") 
\ No newline at end of file
@@ -289,6 +289,12 @@ class TestAgenticCoachAgent:
         assert isinstance(default_summary["recommended_resources"], list)
         assert len(default_summary["recommended_resources"]) == 0
 
+    def test_dedupe_search_topics(self):
+        """Test search topics that only differ by case or spacing are searched once."""
+        topics = ["System Design ", "system  design", "", None, "SQL tuning"]
+
+        assert AgenticCoachAgent._dedupe_search_topics(topics) == ["System Design", "SQL tuning"]
+
 
 class TestSearchTool:
     """Test suite for the search tool used by the agentic coach."""
@@ -349,7 +355,18 @@ class TestSearchTool:
         assert "Python Documentation" in result
         assert "Buy Python Programming Book" not in result
         assert "amazon.com" not in result
-    
+
+    @pytest.mark.asyncio
+    async def test_find_free_resources_returns_resources(self, search_tool):
+        """Test that structured search returns filtered Resource objects."""
+        resources = await search_tool.find_free_resources(
+            skill="Python programming",
+            proficiency_level="beginner",
+            num_results=1
+        )
+
+        assert [r.title for r in resources] == ["Free Python Tutorial"]
+
     def test_search_tool_format_for_llm(self, search_tool, mock_search_service):
         """Test that the search tool formats results correctly for LLM consumption."""
         # Create mock resources without paid content
@@ -11,10 +11,12 @@ from backend.agents.constants import (
     DEFAULT_FALLBACK_QUESTION,
     MINIMUM_QUESTION_COUNT,
     ESTIMATED_TIME_PER_QUESTION,
+    VALID_INTERVIEW_ACTIONS,
     ERROR_AGENT_LOAD_FAILED,
     ERROR_INITIALIZATION_FAILED,
     ERROR_INTERVIEW_SETUP,
     ERROR_PROCESSING_REQUEST,
+    ERROR_EMPTY_MESSAGE,
     ERROR_INTERVIEW_CONCLUDED,
     ERROR_NO_QUESTION_TEXT,
     INTERVIEW_CONCLUSION,
@@ -23,7 +25,8 @@ from backend.agents.constants import (
     LOG_INTERVIEW_CONCLUDED,
     COACH_FEEDBACK_ERROR,
     COACH_FEEDBACK_UNAVAILABLE,
-    COACH_FEEDBACK_NOT_GENERATED
+    COACH_FEEDBACK_NOT_GENERATED,
+    COACH_FEEDBACK_PENDING
 )
 
 
@@ -50,6 +53,7 @@ class TestConstants:
             ERROR_INITIALIZATION_FAILED,
             ERROR_INTERVIEW_SETUP,
             ERROR_PROCESSING_REQUEST,
+            ERROR_EMPTY_MESSAGE,
             ERROR_INTERVIEW_CONCLUDED,
             ERROR_NO_QUESTION_TEXT
         ]
@@ -77,7 +81,8 @@ class TestConstants:
         coach_constants = [
             COACH_FEEDBACK_ERROR,
             COACH_FEEDBACK_UNAVAILABLE,
-            COACH_FEEDBACK_NOT_GENERATED
+            COACH_FEEDBACK_NOT_GENERATED,
+            COACH_FEEDBACK_PENDING
         ]
         
         for coach_msg in coach_constants:
@@ -89,4 +94,8 @@ class TestConstants:
     
     def test_estimated_time_per_question_reasonable(self):
         """Test that estimated time per question is reasonable."""
-        assert 1 <= ESTIMATED_TIME_PER_QUESTION <= 10  # Should be reasonable time in minutes 
\ No newline at end of file
+        assert 1 <= ESTIMATED_TIME_PER_QUESTION <= 10  # Should be reasonable time in minutes 
+    
+    def test_valid_interview_actions(self):
+        """Test that the interviewer's allowed next actions are defined."""
+        assert VALID_INTERVIEW_ACTIONS == {"ask_follow_up", "ask_new_question", "end_interview"}
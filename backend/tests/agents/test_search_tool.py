@@ -0,0 +1,35 @@
+"""
+Tests for search_tool module.
+Tests running searches from synchronous code.
+"""
+
+import asyncio
+
+import pytest
+from backend.agents.tools.search_tool import run_search_sync
+
+
+async def stuck_search():
+    await asyncio.sleep(60)
+
+
+class TestRunSearchSync:
+    """Test the sync-over-async search bridge."""
+
+    def test_returns_result_without_running_loop(self):
+        """Test a search runs to completion when no loop is running."""
+        async def search():
+            return ["resource"]
+
+        assert run_search_sync(search()) == ["resource"]
+
+    def test_times_out_without_running_loop(self):
+        """Test a stuck search raises TimeoutError instead of hanging."""
+        with pytest.raises(TimeoutError):
+            run_search_sync(stuck_search(), timeout=0.05)
+
+    @pytest.mark.asyncio
+    async def test_times_out_inside_running_loop(self):
+        """Test a stuck search called from a loop thread stops blocking that loop."""
+        with pytest.raises(TimeoutError):
+            run_search_sync(stuck_search(), timeout=0.05)
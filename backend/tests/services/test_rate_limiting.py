@@ -0,0 +1,43 @@
+"""
+Tests for rate_limiting module.
+Tests the search slot gate shared across threads and event loops.
+"""
+
+import asyncio
+import threading
+
+from backend.services.rate_limiting import APIRateLimiter
+
+
+class TestSearchRateLimit:
+    """Test search slot acquisition."""
+
+    def test_search_slots_work_across_event_loops(self):
+        """Test searches on separate threads' event loops all get slots instead of failing."""
+        limiter = APIRateLimiter()
+        results = []
+
+        async def use_slot():
+            acquired = await limiter.acquire_search()
+            await asyncio.sleep(0.01)
+            if acquired:
+                limiter.release_search()
+            return acquired
+
+        async def run_searches():
+            return await asyncio.gather(*(use_slot() for _ in range(3)))
+
+        def worker():
+            results.append(asyncio.run(run_searches()))
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [[True, True, True]] * 3
+        stats = limiter.get_usage_stats()["search"]
+        assert stats["errors"] == 0
+        assert stats["active_connections"] == 0
+        assert stats["available_slots"] == limiter.search_limit
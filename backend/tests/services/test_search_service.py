@@ -0,0 +1,171 @@
+"""
+Tests for search_service module.
+Tests the bounded search result cache.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from backend.services import search_service
+from backend.services.search_service import SearchService
+
+
+class FakeProvider:
+    """Search provider stub that counts calls and returns one organic result."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def search(self, query, num_results=10):
+        self.calls += 1
+        await asyncio.sleep(0)  # Yield so concurrent callers overlap
+        return {
+            "organic": [{
+                "title": f"Python Tutorial {self.calls}",
+                "link": "https://docs.python.org/3/tutorial/",
+                "snippet": "Official Python tutorial"
+            }]
+        }
+
+
+@pytest.fixture
+def service():
+    svc = SearchService()
+    svc.provider = FakeProvider()
+    return svc
+
+
+class TestSearchCache:
+    """Test the LRU + TTL search cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_search_uses_cache(self, service):
+        """Test a repeated search is served from the cache."""
+        first = await service.search_resources("python", "beginner")
+        second = await service.search_resources("python", "beginner")
+
+        assert second is first
+        assert service.provider.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_key_ignores_case_and_spacing(self, service):
+        """Test surface variants of the same skill share a cache entry."""
+        await service.search_resources("Python", "Beginner")
+        await service.search_resources("  python ", "beginner")
+
+        assert service.provider.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refetched(self, service, monkeypatch):
+        """Test entries older than the TTL are searched again."""
+        await service.search_resources("python", "beginner")
+
+        clock = search_service._cache_clock() + search_service.SEARCH_CACHE_TTL + 1
+        monkeypatch.setattr(search_service, "_cache_clock", lambda: clock)
+        await service.search_resources("python", "beginner")
+
+        assert service.provider.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(self, service, monkeypatch):
+        """Test the cache stays bounded and evicts the least recently used entry."""
+        monkeypatch.setattr(search_service, "SEARCH_CACHE_MAX_ENTRIES", 2)
+
+        await service.search_resources("python", "beginner")
+        await service.search_resources("java", "beginner")
+        await service.search_resources("python", "beginner")  # python is now most recent
+        await service.search_resources("rust", "beginner")    # evicts java
+
+        assert len(service._search_cache) == 2
+        assert service.provider.calls == 3
+
+        await service.search_resources("python", "beginner")
+        assert service.provider.calls == 3
+
+        await service.search_resources("java", "beginner")
+        assert service.provider.calls == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_searches_share_one_call(self, service):
+        """Test identical searches already in flight are joined, not repeated."""
+        first, second = await asyncio.gather(
+            service.search_resources("python", "beginner"),
+            service.search_resources("python", "beginner")
+        )
+
+        assert first is second
+        assert service.provider.calls == 1
+        assert service._inflight_searches == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_joiner_does_not_fail_owner(self, service):
+        """Test cancelling a caller that joined a search leaves the owner's result intact."""
+        release = asyncio.Event()
+        search = service.provider.search
+
+        async def slow_search(query, num_results=10):
+            await release.wait()
+            return await search(query, num_results)
+
+        service.provider.search = slow_search
+
+        owner = asyncio.create_task(service.search_resources("python", "beginner"))
+        await asyncio.sleep(0)
+        joiner = asyncio.create_task(service.search_resources("python", "beginner"))
+        await asyncio.sleep(0)
+
+        joiner.cancel()
+        release.set()
+
+        resources = await owner
+        assert resources[0].title == "Python Tutorial 1"
+        assert joiner.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_owner_lets_joiner_retry(self, service):
+        """Test a joiner retries the search instead of inheriting the owner's cancellation."""
+        release = asyncio.Event()
+        search = service.provider.search
+
+        async def slow_search(query, num_results=10):
+            await release.wait()
+            return await search(query, num_results)
+
+        service.provider.search = slow_search
+
+        owner = asyncio.create_task(service.search_resources("python", "beginner"))
+        await asyncio.sleep(0)
+        joiner = asyncio.create_task(service.search_resources("python", "beginner"))
+        await asyncio.sleep(0)
+
+        owner.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        resources = await joiner
+        assert resources[0].title == "Python Tutorial 1"
+        assert owner.cancelled()
+        assert service._inflight_searches == {}
+
+    def test_cache_access_is_thread_safe(self, service):
+        """Test concurrent expiry and refresh of the same key from several threads."""
+        expired_at = search_service.SEARCH_CACHE_TTL + 1
+
+        def worker():
+            for _ in range(2000):
+                service._store_cached("key", [], 0.0)
+                service._get_cached("key", expired_at)  # Expires and deletes the entry
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for future in [executor.submit(worker) for _ in range(4)]:
+                future.result()  # Re-raises any KeyError from a worker
+
+    @pytest.mark.asyncio
+    async def test_clear_cache(self, service):
+        """Test clearing the cache forces a new search."""
+        await service.search_resources("python", "beginner")
+        service.clear_cache()
+        await service.search_resources("python", "beginner")
+
+        assert service.provider.calls == 2
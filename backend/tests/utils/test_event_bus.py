@@ -0,0 +1,34 @@
+"""
+Test cases for utils.event_bus module.
+"""
+
+from backend.utils.event_bus import Event, EventBus
+
+
+class TestEventBusHistory:
+    """Test cases for the event bus history."""
+
+    def _publish(self, bus, count, event_type="test_event"):
+        for i in range(count):
+            bus.publish(Event(event_type=event_type, source="test", data={"index": i}))
+
+    def test_history_is_bounded(self):
+        """Test that the oldest events are dropped once the history is full."""
+        bus = EventBus()
+        self._publish(bus, bus.max_history_size + 5)
+
+        assert len(bus.event_history) == bus.max_history_size
+        assert bus.event_history[0].data["index"] == 5
+
+    def test_get_history_returns_latest_events(self):
+        """Test that get_history returns the most recent events as a list."""
+        bus = EventBus()
+        self._publish(bus, 10)
+        self._publish(bus, 3, event_type="other_event")
+
+        latest = bus.get_history(limit=2)
+        assert isinstance(latest, list)
+        assert [e.data["index"] for e in latest] == [1, 2]
+
+        filtered = bus.get_history(event_type="test_event", limit=3)
+        assert [e.data["index"] for e in filtered] == [7, 8, 9]
@@ -6,7 +6,8 @@ Implements a publish/subscribe pattern for event-based communication.
 import uuid
 import json
 import threading
-from typing import Dict, List, Any, Callable, Set
+from collections import deque
+from typing import Deque, Dict, List, Any, Callable, Set
 from datetime import datetime
 from dataclasses import dataclass, field, asdict
 import enum
@@ -31,10 +32,11 @@ class EventType(str, enum.Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """
     Event class for message passing between agents.
+    Slotted, since one is created (and kept in history) for every message and response.
     """
     event_type: str
     source: str
@@ -96,8 +98,9 @@ class EventBus:
         Initialize the event bus with thread safety.
         """
         self.subscribers: Dict[str, List[Callable[[Event], None]]] = {}
-        self.event_history: List[Event] = []
         self.max_history_size = 1000
+        # Bounded deque drops the oldest event in O(1) instead of re-slicing the list
+        self.event_history: Deque[Event] = deque(maxlen=self.max_history_size)
         self.logger = logging.getLogger(__name__)
         self._lock = threading.RLock()  # Reentrant lock for thread safety
     
@@ -109,13 +112,9 @@ class EventBus:
             event: The event to publish
         """
         with self._lock:
-            # Add to history
+            # Add to history (the deque evicts the oldest event once full)
             self.event_history.append(event)
             
-            # Trim history if needed
-            if len(self.event_history) > self.max_history_size:
-                self.event_history = self.event_history[-self.max_history_size:]
-            
             event_type = event.event_type
             
             # Get copy of callbacks to avoid holding lock during callback execution
@@ -186,4 +185,4 @@ class EventBus:
                 filtered = [e for e in self.event_history if e.event_type == event_type]
                 return filtered[-limit:]
             else:
-                return self.event_history[-limit:]
\ No newline at end of file
+                return list(self.event_history)[-limit:]
\ No newline at end of file
@@ -40,9 +40,11 @@ class ChainResultProcessor:
         default_value = default_creator() if default_creator else None
         
         try:
-            self.logger.debug(f"Invoking {chain_name} with inputs: {json.dumps(inputs)[:200]}...")
+            # Serializing the inputs (resume, JD, history) is only worth it when debug logs are emitted
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Invoking %s with inputs: %.200s...", chain_name, json.dumps(inputs))
             result = chain.invoke(inputs)
-            self.logger.debug(f"{chain_name} invocation successful.")
+            self.logger.debug("%s invocation successful.", chain_name)
 
             if not result:
                 self.logger.warning(f"{chain_name} returned an empty result.")
@@ -63,12 +65,12 @@ class ChainResultProcessor:
         # Try direct output_key access
         if isinstance(result, dict) and output_key in result:
             extracted_value = result[output_key]
-            self.logger.debug(f"Extracted value for output key '{output_key}': {str(extracted_value)[:100]}...")
+            self.logger.debug("Extracted value for output key '%s': %.100s...", output_key, extracted_value)
             return self._process_extracted_value(extracted_value)
         
         # Fallback: Try parsing JSON from 'text' field
         if isinstance(result, dict) and 'text' in result and isinstance(result['text'], str):
-            self.logger.debug(f"Output key '{output_key}' not found. Attempting to parse JSON from 'text' field.")
+            self.logger.debug("Output key '%s' not found. Attempting to parse JSON from 'text' field.", output_key)
             parsed_json = self._parse_json_with_fallback(result['text'])
             if parsed_json is not None:
                 return parsed_json
@@ -108,14 +110,14 @@ class ChainResultProcessor:
             match = re.search(r"```(json)?\n(.*?)\n```", json_string, re.DOTALL | re.IGNORECASE)
             if match:
                 json_string_extracted = match.group(2).strip()
-                self.logger.debug(f"Extracted JSON from markdown block: {json_string_extracted[:100]}...")
+                self.logger.debug("Extracted JSON from markdown block: %.100s...", json_string_extracted)
                 return json.loads(json_string_extracted)
             else:
-                self.logger.debug(f"Attempting to parse JSON directly: {json_string[:100]}...")
+                self.logger.debug("Attempting to parse JSON directly: %.100s...", json_string)
                 return json.loads(json_string)
                 
         except json.JSONDecodeError as e:
-            self.logger.debug(f"JSON parsing failed: {e}. String was: {json_string[:200]}...")
+            self.logger.debug("JSON parsing failed: %s. String was: %.200s...", e, json_string)
             return None
         except Exception as e:
             self.logger.error(f"Unexpected error during JSON parsing: {e}")
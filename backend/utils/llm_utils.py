@@ -44,10 +44,10 @@ def parse_json_with_fallback(json_string: str, default_value: Any, logger: loggi
         match = re.search(r"```(json)?\n(.*?)\n```", json_string, re.DOTALL | re.IGNORECASE)
         if match:
             json_string_extracted = match.group(2).strip()
-            logger.debug(f"Extracted JSON from markdown block: {json_string_extracted[:100]}...")
+            logger.debug("Extracted JSON from markdown block: %.100s...", json_string_extracted)
             return json.loads(json_string_extracted)
         else:
-            logger.debug(f"Attempting to parse JSON directly: {json_string[:100]}...")
+            logger.debug("Attempting to parse JSON directly: %.100s...", json_string)
             return json.loads(json_string)
     except json.JSONDecodeError as e:
         logger.error(f"JSON parsing failed: {e}. String was: {json_string[:200]}... Returning default.")